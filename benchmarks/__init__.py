@@ -0,0 +1 @@
+"""Local tooling for measuring the Autobayt integration at fleet scale."""
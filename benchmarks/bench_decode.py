@@ -0,0 +1,107 @@
+"""Memory benchmark for decoding the account device list.
+
+Compares, per account size, the peak and retained memory of:
+
+- ``full``: the previous path, decoding the whole body and keeping it
+- ``projected``: joined chunks decoded at once, then reduced to
+  ``DISCOVERY_FIELDS``
+- ``streaming``: devices parsed and reduced one by one with ``ijson``
+  (only when it is installed)
+
+Requires Home Assistant to be installed::
+
+    python -m benchmarks.bench_decode --sizes 100 1000 5000 --padding 512
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from homeassistant.util.json import json_loads
+
+from custom_components.autobayt.const import HTTP_STREAM_CHUNK_SIZE
+from custom_components.autobayt.decoding import HAS_STREAMING_BACKEND, DeviceListDecoder
+
+from .fake_autobayt import make_device
+
+
+def _decode_full(body: bytes) -> Any:
+    """Decode the whole body, as the client did before streaming."""
+    return json_loads(body)
+
+
+def _decoder_path(streaming: bool) -> Callable[[bytes], Any]:
+    """Return a function feeding a body to a decoder in network-sized chunks."""
+
+    def decode(body: bytes) -> Any:
+        decoder = DeviceListDecoder(streaming=streaming)
+        for offset in range(0, len(body), HTTP_STREAM_CHUNK_SIZE):
+            decoder.feed(body[offset:offset + HTTP_STREAM_CHUNK_SIZE])
+        return decoder.close()
+
+    return decode
+
+
+def _measure(decode: Callable[[bytes], Any], body: bytes) -> Dict[str, float]:
+    """Return time, peak and retained memory of one decode."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = decode(body)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {
+        "ms": elapsed * 1000,
+        "peak_kib": peak / 1024,
+        "retained_kib": retained / 1024,
+    }
+
+
+def run_size(device_count: int, padding: int) -> List[Dict[str, Any]]:
+    """Benchmark every decoding path for one account size."""
+    body = json.dumps(
+        [make_device(index, "0" * 24, padding=padding) for index in range(device_count)]
+    ).encode()
+
+    paths: Dict[str, Callable[[bytes], Any]] = {
+        "full": _decode_full,
+        "projected": _decoder_path(streaming=False),
+    }
+    if HAS_STREAMING_BACKEND:
+        paths["streaming"] = _decoder_path(streaming=True)
+
+    return [
+        {"devices": device_count, "body_kib": len(body) / 1024, "path": name, **_measure(decode, body)}
+        for name, decode in paths.items()
+    ]
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    """Print the results as a fixed-width table."""
+    columns = list(results[0])
+    print("  ".join(f"{column:>12}" for column in columns))
+    for result in results:
+        print("  ".join(
+            f"{value:>12.1f}" if isinstance(value, float) else f"{value:>12}"
+            for value in result.values()
+        ))
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--padding", type=int, default=0, help="extra bytes per device")
+    args = parser.parse_args()
+
+    if not HAS_STREAMING_BACKEND:
+        print("ijson is not installed; skipping the streaming path")
+    _print_table([row for size in args.sizes for row in run_size(size, args.padding)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Fleet-scale benchmark for the Autobayt coordinator and platforms.
+
+Runs the real ``AutobaytCoordinator`` and entity classes against the local
+fake API and reports, per fleet size:
+
+- full poll-cycle time and requests per cycle
+- entity render time for every entity of the fleet
+- trigger and confirmation latency of switch commands
+- peak and retained memory of a poll cycle
+
+Requires Home Assistant and aiohttp to be installed::
+
+    python -m benchmarks.bench_fleet --sizes 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+from homeassistant.config_entries import ConfigEntries
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry as ir
+
+from custom_components.autobayt.api import AutobaytApiClient
+from custom_components.autobayt.coordinator import AutobaytCoordinator
+from custom_components.autobayt.governor import TokenBucket
+from custom_components.autobayt.sensor import _create_device_sensors
+from custom_components.autobayt.switch import AutobaytSwitchEntity
+from custom_components.autobayt.update import AutobaytUpdateEntity
+
+from .fake_autobayt import FakeAutobaytApi
+
+TOGGLE_SAMPLES = 20
+
+
+def _render(entities: List[Any]) -> None:
+    """Evaluate the state properties Home Assistant reads on a state write."""
+    for entity in entities:
+        entity.available
+        entity.device_info
+        entity.extra_state_attributes
+        if isinstance(entity, AutobaytSwitchEntity):
+            entity.is_on
+        elif isinstance(entity, AutobaytUpdateEntity):
+            entity.installed_version
+            entity.latest_version
+            entity.in_progress
+        else:
+            entity.native_value
+
+
+def _build_entities(coordinator: AutobaytCoordinator, device_ids: List[str]) -> List[Any]:
+    """Create the entities the platforms would create for each device."""
+    entities: List[Any] = []
+    for device_id in device_ids:
+        device = coordinator.get_device(device_id)
+        name = device.name if device and device.name else device_id
+        for button_id, button in (device.buttons.items() if device else ()):
+            entities.append(
+                AutobaytSwitchEntity(coordinator, device_id, name, button_id, button.name or "")
+            )
+        entities.extend(_create_device_sensors(coordinator, device_id, {"name": name}))
+        entities.append(AutobaytUpdateEntity(coordinator, device_id, name))
+    return entities
+
+
+async def run_fleet(device_count: int, latency: float, unthrottled: bool) -> Dict[str, Any]:
+    """Benchmark one fleet size."""
+    fake = FakeAutobaytApi(device_count, latency=latency, jitter=latency / 2)
+    base_url = await fake.async_start()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.config_entries = ConfigEntries(hass, {})
+        # Discovery raises and clears repair issues on the first list poll
+        await ir.async_load(hass)
+        entry = SimpleNamespace(entry_id="bench", data={"user_id": fake.user_id}, options={})
+
+        api = AutobaytApiClient(base_url=base_url)
+        if unthrottled:
+            api.governor.bucket = TokenBucket(rate=1e9, capacity=10**9)
+        coordinator = AutobaytCoordinator(hass, entry, api=api)
+        coordinator.entry_ids.add(entry.entry_id)
+        for device_id in fake.devices:
+            coordinator.register_device(device_id)
+
+        # Full cycle: every device is due
+        fake.reset_counters()
+        tracemalloc.start()
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        cycle_time = time.perf_counter() - start
+        cycle_current, cycle_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        cycle_requests = sum(fake.requests.values())
+        cycle_bytes = fake.bytes_sent
+
+        # Quiet cycle: nothing is due yet
+        fake.reset_counters()
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        quiet_time = time.perf_counter() - start
+        quiet_requests = sum(fake.requests.values())
+
+        device_ids = list(fake.devices)
+        entities = _build_entities(coordinator, device_ids)
+        start = time.perf_counter()
+        _render(entities)
+        render_time = time.perf_counter() - start
+
+        trigger_times: List[float] = []
+        confirm_times: List[float] = []
+        for device_id in device_ids[:TOGGLE_SAMPLES]:
+            button_id = next(iter(coordinator.get_device(device_id).buttons))
+            start = time.perf_counter()
+            await coordinator.commands.async_set_button(device_id, button_id, True)
+            trigger_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            await coordinator.async_confirm_buttons(device_id, {button_id: True})
+            confirm_times.append(time.perf_counter() - start)
+
+        coordinator.entry_ids.clear()
+        await coordinator.async_shutdown()
+
+    await fake.async_stop()
+
+    return {
+        "devices": device_count,
+        "entities": len(entities),
+        "cycle_s": cycle_time,
+        "cycle_requests": cycle_requests,
+        "cycle_kib": cycle_bytes / 1024,
+        "quiet_s": quiet_time,
+        "quiet_requests": quiet_requests,
+        "render_ms": render_time * 1000,
+        "trigger_ms": statistics.median(trigger_times) * 1000,
+        "confirm_ms": statistics.median(confirm_times) * 1000,
+        "peak_mib": cycle_peak / 2**20,
+        "retained_mib": cycle_current / 2**20,
+    }
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    """Print the results as a fixed-width table."""
+    columns = list(results[0])
+    print("  ".join(f"{column:>14}" for column in columns))
+    for result in results:
+        print("  ".join(
+            f"{value:>14.3f}" if isinstance(value, float) else f"{value:>14}"
+            for value in result.values()
+        ))
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run every requested fleet size."""
+    results = [
+        await run_fleet(size, args.latency, args.unthrottled) for size in args.sizes
+    ]
+    _print_table(results)
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.05, help="fake API latency in seconds")
+    parser.add_argument(
+        "--unthrottled",
+        action="store_true",
+        help="lift the per-account rate limit to measure raw fan-out",
+    )
+    asyncio.run(_async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
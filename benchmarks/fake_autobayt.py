@@ -0,0 +1,219 @@
+"""Local stand-in for the Autobayt cloud API.
+
+Serves ``get-things``, ``device?device_id=`` and ``device/trigger`` for any
+number of synthetic SW100/SW200/SW300 devices. Latency, error rate and
+payload size are configurable, and every request is counted so benchmarks
+can report requests per cycle.
+
+Run standalone with::
+
+    python -m benchmarks.fake_autobayt --devices 100 --port 8080
+
+and point an ``AutobaytApiClient`` at ``http://127.0.0.1:8080/v1``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+import random
+from typing import Any, Dict
+
+from aiohttp import web
+
+MODELS = (
+    ("SW100HV1", 1),
+    ("SW100PMV1", 1),
+    ("SW200LV1", 2),
+    ("SW300LV1", 3),
+)
+
+
+def make_device_id(index: int) -> str:
+    """Return the MAC-style device_id of a synthetic device."""
+    return "AB:%02X:%02X:%02X:%02X:%02X" % (
+        (index >> 32) & 0xFF,
+        (index >> 24) & 0xFF,
+        (index >> 16) & 0xFF,
+        (index >> 8) & 0xFF,
+        index & 0xFF,
+    )
+
+
+def make_device(index: int, user_id: str, hub_every: int = 10, padding: int = 0) -> Dict[str, Any]:
+    """Return a synthetic device payload.
+
+    Every ``hub_every``-th device is a hub and the devices after it are its
+    slaves, mirroring the hub/slave layout of real accounts. ``padding``
+    adds a filler field of that many bytes to grow the payload.
+    """
+    model_name, button_count = MODELS[index % len(MODELS)]
+    hub_index = index - index % hub_every
+    is_hub = index == hub_index
+
+    device = {
+        "device_id": make_device_id(index),
+        "user_id": user_id,
+        "name": f"Switch {index:04d}",
+        "model_name": model_name,
+        "firmware_version": "1.2.0",
+        "next_firmware": [
+            {
+                "version_name": "1.3.0",
+                "version_code": 130,
+                "file_name": f"{model_name.lower()}_1.3.0.bin",
+                "require_client_update": False,
+            }
+        ],
+        "connection_status": True,
+        "is_hub": is_hub,
+        "slave_id": "" if is_hub else make_device_id(hub_index),
+        "is_updating": False,
+        "perc": 0,
+        "period": 0,
+        "pat_period": 0,
+        "sstr": -40 - index % 50,
+        "loc_id": "loc-1",
+        "room_id": f"room-{index % 12}",
+        "room_name": f"Room {index % 12}",
+        "buttons": [
+            {
+                "button_id": button_id,
+                "name": f"Button {button_id}",
+                "switch_state": False,
+                "dpb_state": False,
+                "power_on_state": "off",
+                "mode": "toggle",
+                "toggle_delay": 0,
+            }
+            for button_id in range(1, button_count + 1)
+        ],
+    }
+    if padding:
+        device["notes"] = "x" * padding
+    return device
+
+
+class FakeAutobaytApi:
+    """In-memory Autobayt account served over aiohttp."""
+
+    def __init__(
+        self,
+        device_count: int,
+        user_id: str = "0" * 24,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        padding: int = 0,
+        seed: int = 0,
+    ) -> None:
+        """Create the synthetic account."""
+        self.user_id = user_id
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._random = random.Random(seed)
+        self.devices: Dict[str, Dict[str, Any]] = {}
+        for index in range(device_count):
+            device = make_device(index, user_id, padding=padding)
+            self.devices[device["device_id"]] = device
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application()
+        app.router.add_get("/v1/user/get-things", self._get_things)
+        app.router.add_get("/v1/device", self._get_device)
+        app.router.add_post("/v1/device/trigger", self._trigger)
+        return app
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the API base URL."""
+        self._runner = web.AppRunner(self.app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}/v1"
+        return self.base_url
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset_counters(self) -> None:
+        """Zero the request and byte counters."""
+        self.requests.clear()
+        self.bytes_sent = 0
+
+    async def _respond(self, endpoint: str, payload: Any) -> web.Response:
+        """Apply latency and error injection, then answer with JSON."""
+        self.requests[endpoint] += 1
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.Response(status=503, text="injected failure")
+        response = web.json_response(payload)
+        self.bytes_sent += len(response.body)
+        return response
+
+    async def _get_things(self, request: web.Request) -> web.Response:
+        """Return every device of the account."""
+        if request.query.get("user_id") != self.user_id:
+            return await self._respond("get-things", [])
+        return await self._respond("get-things", list(self.devices.values()))
+
+    async def _get_device(self, request: web.Request) -> web.Response:
+        """Return the details of one device."""
+        device = self.devices.get(request.query.get("device_id", ""))
+        if device is None:
+            self.requests["device"] += 1
+            return web.Response(status=404, text="not found")
+        return await self._respond("device", device)
+
+    async def _trigger(self, request: web.Request) -> web.Response:
+        """Apply button states to a device."""
+        body = await request.json()
+        device = self.devices.get(body.get("device_id", ""))
+        if device is None:
+            self.requests["trigger"] += 1
+            return web.Response(status=404, text="not found")
+        states = dict(zip(body.get("btnIds", []), body.get("btnStates", [])))
+        for button in device["buttons"]:
+            if button["button_id"] in states:
+                button["switch_state"] = states[button["button_id"]]
+        return await self._respond("trigger", {"success": True})
+
+
+def main() -> None:
+    """Serve a fake account until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=100)
+    parser.add_argument("--user-id", default="0" * 24)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per response")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 503 responses")
+    parser.add_argument("--padding", type=int, default=0, help="extra bytes per device")
+    args = parser.parse_args()
+
+    api = FakeAutobaytApi(
+        args.devices,
+        user_id=args.user_id,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        padding=args.padding,
+    )
+    web.run_app(api.app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,28 @@
 """The Autobayt integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_USER_ID
+from .const import (
+    CONF_USER_ID,
+    DATA_ACCOUNTS,
+    DATA_ACCOUNTS_LOCK,
+    DOMAIN,
+    ISSUE_DEVICE_REMOVED,
+    ISSUE_NEW_DEVICES,
+)
 from .coordinator import AutobaytCoordinator
+from .services import async_setup_services
+from .snapshot import AutobaytSnapshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,33 +33,162 @@ PLATFORMS: list[Platform] = [
     Platform.UPDATE,
 ]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Autobayt services."""
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Autobayt from a config entry."""
     _LOGGER.debug("Setting up Autobayt integration")
     
-    coordinator = AutobaytCoordinator(hass, entry)
-    
     hass.data.setdefault(DOMAIN, {})
+    device_id = entry.data.get("device_id")
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    
+    coordinator = await _async_get_coordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    timings["coordinator"] = time.perf_counter() - start
     
-    await coordinator.async_config_entry_first_refresh()
+    # Register every platform of the entry before any device fetch
+    await asyncio.gather(
+        *(_async_forward_platform(hass, entry, platform, timings) for platform in PLATFORMS)
+    )
     
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if device_id:
+        # One fetch per device, skipped if a poll or the snapshot covers it.
+        # It runs in the background so setup never waits on the API.
+        entry.async_create_background_task(
+            hass,
+            _async_ensure_device(coordinator, entry, device_id),
+            f"{DOMAIN}_ensure_{device_id}",
+        )
     
-    if CONF_USER_ID in entry.data:
+    if _is_account_entry(entry):
         await coordinator.async_start_discovery()
     
+    timings["total"] = time.perf_counter() - start
+    coordinator.startup_timings[entry.entry_id] = {
+        step: round(seconds, 4) for step, seconds in timings.items()
+    }
+    _LOGGER.debug("Set up entry %s in %.3fs: %s", entry.title, timings["total"], timings)
+    
     return True
 
 
+async def _async_ensure_device(
+    coordinator: AutobaytCoordinator, entry: ConfigEntry, device_id: str
+) -> None:
+    """Fetch the device of an entry once and record how long it took."""
+    start = time.perf_counter()
+    await coordinator.async_ensure_device(device_id)
+    if timings := coordinator.startup_timings.get(entry.entry_id):
+        timings["device_fetch"] = round(time.perf_counter() - start, 4)
+
+
+async def _async_forward_platform(
+    hass: HomeAssistant, entry: ConfigEntry, platform: Platform, timings: dict[str, float]
+) -> None:
+    """Forward one platform setup and record how long it took."""
+    start = time.perf_counter()
+    await hass.config_entries.async_forward_entry_setups(entry, [platform])
+    timings[f"platform.{platform}"] = time.perf_counter() - start
+
+
+def _is_account_entry(entry: ConfigEntry) -> bool:
+    """Return True for the main user_id entry of an account.
+
+    Device entries also carry the user_id of their account, so the presence
+    of device_id is what tells the two apart.
+    """
+    return CONF_USER_ID in entry.data and "device_id" not in entry.data
+
+
+async def _async_get_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AutobaytCoordinator:
+    """Return the shared account coordinator for an entry, creating it if needed."""
+    user_id = entry.data.get(CONF_USER_ID)
+    
+    if not user_id:
+        coordinator = await _async_start_coordinator(hass, entry)
+        coordinator.entry_ids.add(entry.entry_id)
+        return coordinator
+    
+    accounts: dict[str, AutobaytCoordinator] = hass.data[DOMAIN].setdefault(DATA_ACCOUNTS, {})
+    lock: asyncio.Lock = hass.data[DOMAIN].setdefault(DATA_ACCOUNTS_LOCK, asyncio.Lock())
+    
+    async with lock:
+        coordinator = accounts.get(user_id)
+        if coordinator is None:
+            _LOGGER.debug("Creating account poller for user %s", user_id)
+            coordinator = await _async_start_coordinator(hass, entry)
+            accounts[user_id] = coordinator
+        
+        coordinator.entry_ids.add(entry.entry_id)
+        if device_id := entry.data.get("device_id"):
+            coordinator.register_device(device_id)
+    
+    return coordinator
+
+
+async def _async_start_coordinator(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> AutobaytCoordinator:
+    """Create a coordinator and load its first data.
+
+    With a saved snapshot, entities come up immediately and the live refresh
+    reconciles in the background. Without one, setup waits for the API.
+    """
+    coordinator = AutobaytCoordinator(hass, entry)
+    
+    # Registered up front so the first refresh already includes the device
+    if device_id := entry.data.get("device_id"):
+        coordinator.register_device(device_id)
+    
+    if await coordinator.async_restore_snapshot():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_refresh_{entry.entry_id}"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    
+    return coordinator
+
+
+async def _async_release_coordinator(
+    hass: HomeAssistant, coordinator: AutobaytCoordinator, entry: ConfigEntry
+) -> None:
+    """Detach an entry from its coordinator and shut it down when unused."""
+    coordinator.entry_ids.discard(entry.entry_id)
+    
+    if "device_id" in entry.data:
+        await coordinator.async_remove_device(entry.data["device_id"])
+    
+    if coordinator.entry_ids:
+        return
+    
+    if coordinator.user_id:
+        accounts = hass.data[DOMAIN].get(DATA_ACCOUNTS, {})
+        if accounts.get(coordinator.user_id) is coordinator:
+            accounts.pop(coordinator.user_id)
+    
+    _LOGGER.debug("Shutting down poller for %s", coordinator.user_id or coordinator.device_id)
+    await coordinator.async_shutdown()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Autobayt integration entry: %s", entry.entry_id)
     
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        await coordinator.async_shutdown()
+        await _async_release_coordinator(hass, coordinator, entry)
     
     return unload_ok
 
@@ -55,7 +197,7 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Remove a config entry."""
     _LOGGER.debug("Removing Autobayt integration entry: %s", entry.entry_id)
     
-    if CONF_USER_ID in entry.data:
+    if _is_account_entry(entry):
         _LOGGER.debug("Removing main integration - cleaning up all devices")
         await _async_cleanup_integration_devices(hass, entry)
     elif "device_id" in entry.data:
@@ -65,37 +207,35 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
 async def _async_cleanup_device_and_rediscover(hass: HomeAssistant, device_entry: ConfigEntry) -> None:
     """Clean up a single device and trigger rediscovery."""
-    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    from homeassistant.helpers import device_registry as dr
     from homeassistant.helpers import discovery_flow
+    from homeassistant.helpers import issue_registry as ir
     
     device_registry = dr.async_get(hass)
-    entity_registry = er.async_get(hass)
     
     device_id = device_entry.data.get("device_id")
     if not device_id:
         return
+    
+    ir.async_delete_issue(hass, DOMAIN, f"{ISSUE_DEVICE_REMOVED}_{device_id}")
         
     _LOGGER.debug("Cleaning up device: %s", device_id)
     
-    device = None
-    for dev in device_registry.devices.values():
-        if any(identifier == (DOMAIN, device_id) for identifier in dev.identifiers):
-            device = dev
-            break
+    start = time.perf_counter()
     
+    # Identifier index lookup; removing the device also drops its entities
+    device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
     if device:
-        entities = er.async_entries_for_device(entity_registry, device.id)
-        for entity in entities:
-            if entity.platform == DOMAIN:
-                _LOGGER.debug("Removing entity: %s", entity.entity_id)
-                entity_registry.async_remove(entity.entity_id)
-                
         _LOGGER.debug("Removing device from registry: %s", device.name)
         device_registry.async_remove_device(device.id)
     
+    _LOGGER.debug(
+        "Cleaned up device %s in %.3fs", device_id, time.perf_counter() - start
+    )
+    
     main_entry = None
     for entry in hass.config_entries.async_entries(DOMAIN):
-        if CONF_USER_ID in entry.data:
+        if _is_account_entry(entry):
             main_entry = entry
             break
     
@@ -126,41 +266,61 @@ async def _async_cleanup_device_and_rediscover(hass: HomeAssistant, device_entry
 
 
 async def _async_cleanup_integration_devices(hass: HomeAssistant, main_entry: ConfigEntry) -> None:
-    """Clean up all devices and device entries for this integration."""
-    from homeassistant.helpers import device_registry as dr, entity_registry as er
+    """Clean up all devices and device entries for this integration.
+
+    Devices are found through the config entry and identifier indexes of the
+    registries instead of scanning every device in Home Assistant.
+    """
+    from homeassistant.helpers import device_registry as dr
+    from homeassistant.helpers import issue_registry as ir
     
+    start = time.perf_counter()
     device_registry = dr.async_get(hass)
-    entity_registry = er.async_get(hass)
+    user_id = main_entry.data.get(CONF_USER_ID)
     
-    integration_devices = []
-    for device in device_registry.devices.values():
-        if any(identifier[0] == DOMAIN for identifier in device.identifiers):
-            integration_devices.append(device)
-            
-    _LOGGER.debug("Found %d devices to clean up", len(integration_devices))
-    
-    for device in integration_devices:
-        entities = er.async_entries_for_device(entity_registry, device.id)
-        for entity in entities:
-            if entity.platform == DOMAIN:
-                _LOGGER.debug("Removing entity: %s", entity.entity_id)
-                entity_registry.async_remove(entity.entity_id)
-                
-        _LOGGER.debug("Removing device: %s", device.name)
-        device_registry.async_remove_device(device.id)
+    device_entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id != main_entry.entry_id
+        and "device_id" in entry.data
+        and entry.data.get(CONF_USER_ID) in (None, user_id)
+    ]
+    device_ids = {entry.data["device_id"] for entry in device_entries}
+    
+    coordinator = hass.data.get(DOMAIN, {}).get(DATA_ACCOUNTS, {}).get(user_id)
+    if coordinator and coordinator.data:
+        device_ids.update(
+            device["device_id"]
+            for device in coordinator.data.get("user_devices", [])
+            if device.get("device_id")
+        )
+    
+    # Removing a config entry clears its devices and entities in bulk
+    for entry in device_entries:
+        _LOGGER.debug("Removing device config entry: %s", entry.data.get("device_id"))
+    await asyncio.gather(
+        *(hass.config_entries.async_remove(entry.entry_id) for entry in device_entries)
+    )
+    
+    # Devices left without a device entry are removed through the identifier index
+    removed_devices = 0
+    for device_id in device_ids:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device:
+            _LOGGER.debug("Removing device: %s", device.name)
+            device_registry.async_remove_device(device.id)
+            removed_devices += 1
     
-    user_id = main_entry.data.get(CONF_USER_ID)
     if user_id:
-        entries_to_remove = []
-        for entry in hass.config_entries.async_entries(DOMAIN):
-            if (entry.entry_id != main_entry.entry_id and 
-                CONF_USER_ID not in entry.data and 
-                "device_id" in entry.data):
-                entries_to_remove.append(entry)
-                
-        for entry in entries_to_remove:
-            _LOGGER.debug("Removing device config entry: %s", entry.data.get("device_id"))
-            await hass.config_entries.async_remove(entry.entry_id)
+        ir.async_delete_issue(hass, DOMAIN, f"{ISSUE_NEW_DEVICES}_{user_id}")
+        await AutobaytSnapshotStore(hass, user_id).async_remove()
+    
+    _LOGGER.info(
+        "Removed %d device entries and %d orphaned devices in %.3fs",
+        len(device_entries),
+        removed_devices,
+        time.perf_counter() - start,
+    )
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
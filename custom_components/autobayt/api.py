@@ -0,0 +1,271 @@
+"""Autobayt API client."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List
+
+import aiohttp
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    API_BASE_URL,
+    DEVICE_CACHE_TTL,
+    DEVICE_DETAIL_PATH,
+    DEVICE_TRIGGER_PATH,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_STREAM_CHUNK_SIZE,
+    REQUEST_TIMEOUT,
+    USER_DEVICE_LIST_PATH,
+)
+from .decoding import DeviceListDecoder
+from .governor import AutobaytRequestGovernor
+from .metrics import (
+    ENDPOINT_DEVICE,
+    ENDPOINT_TRIGGER,
+    ENDPOINT_USER_DEVICES,
+    AutobaytMetrics,
+)
+from .request_scheduler import AutobaytRequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AutobaytApiClient:
+    """Pooled client for the Autobayt cloud API.
+
+    An account keeps one client for polling, switch commands and config
+    flows. The underlying session holds keep-alive connections and caches
+    DNS lookups, so commands skip connection setup once the pool is warm.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession | None = None,
+        base_url: str = API_BASE_URL,
+        scheduler: AutobaytRequestScheduler | None = None,
+        account: str = "",
+    ) -> None:
+        """Initialize the client, optionally on top of an existing session.
+
+        With a scheduler, every request first takes a slot shared with the
+        clients of the other accounts, queued under ``account``.
+        """
+        self._session = session
+        self._user_device_list_url = f"{base_url}{USER_DEVICE_LIST_PATH}"
+        self._device_detail_url = f"{base_url}{DEVICE_DETAIL_PATH}"
+        self._device_trigger_url = f"{base_url}{DEVICE_TRIGGER_PATH}"
+        self._owns_session = session is None
+        self.governor = AutobaytRequestGovernor()
+        self._inflight: Dict[str, asyncio.Task[Any]] = {}
+        self._waiters: Dict[str, int] = {}
+        self._device_cache: Dict[str, tuple[float, Any]] = {}
+        self._invalidated_at: Dict[str, float] = {}
+        self.metrics = AutobaytMetrics()
+        self.scheduler = scheduler
+        self.account = account
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_CONNECTION_LIMIT,
+                    ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+                    keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+                    ssl=get_default_context(),
+                ),
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
+            self._owns_session = True
+        return self._session
+
+    async def async_get_user_devices(self, user_id: str) -> List[Dict[str, Any]]:
+        """Return the device list of an account.
+
+        The body is decoded as it streams in and each device is reduced to
+        the ``DISCOVERY_FIELDS`` used by discovery and entity setup.
+        """
+        return await self._async_get(
+            f"{self._user_device_list_url}{user_id}",
+            ENDPOINT_USER_DEVICES,
+            DeviceListDecoder,
+        )
+
+    async def async_get_device(self, device_id: str, max_age: float = DEVICE_CACHE_TTL) -> Any:
+        """Return the raw detail payload of a device.
+
+        A payload fetched less than ``max_age`` seconds ago is returned from
+        the cache; pass 0 to force a request. Trigger commands invalidate the
+        cached payload of their device. A deleted device surfaces as
+        ``aiohttp.ClientResponseError`` with status 404.
+        """
+        cached = self._device_cache.get(device_id)
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            self.metrics.record_cache_hit()
+            return cached[1]
+        
+        requested_at = time.monotonic()
+        data = await self._async_get(f"{self._device_detail_url}{device_id}", ENDPOINT_DEVICE)
+        
+        # A trigger sent while the request was in flight makes the answer stale
+        if isinstance(data, dict) and requested_at > self._invalidated_at.get(device_id, 0.0):
+            self._device_cache[device_id] = (time.monotonic(), data)
+        return data
+
+    def invalidate_device(self, device_id: str) -> None:
+        """Drop the cached payload of a device."""
+        self._device_cache.pop(device_id, None)
+        self._invalidated_at[device_id] = time.monotonic()
+
+    async def async_trigger(
+        self, device_id: str, button_ids: List[int], states: List[bool]
+    ) -> None:
+        """Set the state of one or more buttons of a device."""
+        payload = {
+            "btnStates": states,
+            "btnIds": button_ids,
+            "device_id": device_id,
+        }
+        try:
+            await self.governor.async_call(
+                lambda: self._async_post(self._device_trigger_url, payload, ENDPOINT_TRIGGER)
+            )
+        finally:
+            self.invalidate_device(device_id)
+
+    async def _async_get(
+        self,
+        url: str,
+        endpoint: str,
+        decoder_factory: Callable[[], DeviceListDecoder] | None = None,
+    ) -> Any:
+        """Perform a governed GET request and decode the JSON body.
+
+        Concurrent requests for the same URL share one HTTP call and receive
+        the same decoded object, which callers must treat as read-only. The
+        shared call is cancelled once every caller waiting on it is.
+        """
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(
+                self.governor.async_call(
+                    lambda: self._async_get_once(url, endpoint, decoder_factory)
+                )
+            )
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._forget_inflight(url, done))
+        else:
+            _LOGGER.debug("Joining in-flight request for %s", url)
+        
+        self._waiters[url] = self._waiters.get(url, 0) + 1
+        try:
+            # Shielded so one cancelled caller does not abort the shared request
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[url] == 1 and self._inflight.get(url) is task:
+                # Nobody is left to use the answer; stop spending tokens on it
+                task.cancel()
+            raise
+        finally:
+            self._waiters[url] -= 1
+            if not self._waiters[url]:
+                del self._waiters[url]
+
+    def _forget_inflight(self, url: str, task: asyncio.Task[Any]) -> None:
+        """Drop a finished request from the in-flight table."""
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+
+    @asynccontextmanager
+    async def _request_slot(self) -> AsyncIterator[None]:
+        """Hold a shared request slot, if a scheduler is set, and record the wait."""
+        if self.scheduler is None:
+            yield
+            return
+        
+        start = time.perf_counter()
+        async with self.scheduler.slot(self.account):
+            self.metrics.record_queue_wait(time.perf_counter() - start)
+            yield
+
+    async def _async_post(self, url: str, payload: Dict[str, Any], endpoint: str) -> None:
+        """Perform a single POST request."""
+        async with self._request_slot():
+            await self._async_post_once(url, payload, endpoint)
+
+    async def _async_post_once(self, url: str, payload: Dict[str, Any], endpoint: str) -> None:
+        """Send a POST request and record its metrics."""
+        start = time.perf_counter()
+        try:
+            async with self.session.post(
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            ) as response:
+                response.raise_for_status()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record_request(endpoint, time.perf_counter() - start, error=True)
+            raise
+        self.metrics.record_request(endpoint, time.perf_counter() - start)
+
+    async def _async_get_once(
+        self,
+        url: str,
+        endpoint: str,
+        decoder_factory: Callable[[], DeviceListDecoder] | None = None,
+    ) -> Any:
+        """Perform a single GET request and decode the JSON body.
+
+        With a decoder, the body is fed to it chunk by chunk instead of
+        being read into memory first.
+        """
+        async with self._request_slot():
+            return await self._async_fetch(url, endpoint, decoder_factory)
+
+    async def _async_fetch(
+        self,
+        url: str,
+        endpoint: str,
+        decoder_factory: Callable[[], DeviceListDecoder] | None,
+    ) -> Any:
+        """Send a GET request, decode the body and record its metrics."""
+        start = time.perf_counter()
+        decoder = decoder_factory() if decoder_factory else None
+        try:
+            async with self.session.get(
+                url, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as response:
+                response.raise_for_status()
+                if decoder is not None:
+                    async for chunk in response.content.iter_chunked(HTTP_STREAM_CHUNK_SIZE):
+                        decoder.feed(chunk)
+                else:
+                    body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.metrics.record_request(endpoint, time.perf_counter() - start, error=True)
+            raise
+        if decoder is not None:
+            self.metrics.record_request(endpoint, time.perf_counter() - start, decoder.size)
+            return decoder.close()
+        self.metrics.record_request(endpoint, time.perf_counter() - start, len(body))
+        # An empty body decodes to None, like aiohttp's response.json()
+        return json_loads(body) if body.strip() else None
+
+    async def async_close(self) -> None:
+        """Close the session if this client created it."""
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._device_cache.clear()
+        self._invalidated_at.clear()
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import logging
 from typing import Any, Dict
-from packaging import version
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -12,18 +11,17 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_FIRMWARE_VERSION,
-    ATTR_IS_HUB,
-    ATTR_MODEL_NAME,
     ATTR_NEXT_FIRMWARE,
-    ATTR_SLAVE_ID,
     DOMAIN,
 )
 from .coordinator import AutobaytCoordinator
+from .models import AutobaytDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,6 +45,9 @@ async def async_setup_entry(
 class AutobaytBinarySensorEntity(CoordinatorEntity, BinarySensorEntity):
     """Base Autobayt binary sensor entity."""
 
+    # Payload keys rendered by the sensor; None subscribes to every change
+    _source_fields: frozenset[str] | None = None
+
     def __init__(
         self,
         coordinator: AutobaytCoordinator,
@@ -55,53 +56,35 @@ class AutobaytBinarySensorEntity(CoordinatorEntity, BinarySensorEntity):
         sensor_type: str,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(device_id, self._source_fields))
         self._device_id = device_id
         self._device_name = device_name
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{device_id}_{sensor_type}"
 
     @property
-    def device_info(self) -> Dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        device_data = self.coordinator.data.get("device_data", {}).get(self._device_id, {})
-        model_name = device_data.get(ATTR_MODEL_NAME, "Unknown")
-        firmware_version = device_data.get(ATTR_FIRMWARE_VERSION, "Unknown")
-        
-        info = {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": self._device_name,
-            "manufacturer": "Autobayt",
-            "model": model_name,
-            "sw_version": firmware_version,
-            "connections": {("mac", self._device_id)},
-        }
-        
-        # Add via_device for slave devices connected to a hub
-        is_hub = device_data.get(ATTR_IS_HUB, False)
-        slave_id = device_data.get(ATTR_SLAVE_ID, "")
-        
-        if not is_hub and slave_id:
-            info["via_device"] = (DOMAIN, slave_id)
-        
-        return info
+        return self.coordinator.get_device_info(self._device_id, self._device_name)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data.get("device_data", {})
+            and self._device_id in self.coordinator.devices
         )
 
-    def _get_device_data(self) -> Dict[str, Any]:
-        """Get current device data."""
-        return self.coordinator.data.get("device_data", {}).get(self._device_id, {})
+    def _get_device(self) -> AutobaytDevice | None:
+        """Get the current device record."""
+        return self.coordinator.get_device(self._device_id)
 
 
 class AutobaytFirmwareUpdateSensor(AutobaytBinarySensorEntity):
     """Autobayt firmware update available sensor."""
 
+    _source_fields = frozenset({ATTR_FIRMWARE_VERSION, ATTR_NEXT_FIRMWARE})
+
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
@@ -114,42 +97,21 @@ class AutobaytFirmwareUpdateSensor(AutobaytBinarySensorEntity):
     @property
     def is_on(self) -> bool:
         """Return true if firmware update is available."""
-        device_data = self._get_device_data()
-        current_version = device_data.get(ATTR_FIRMWARE_VERSION)
-        next_firmware = device_data.get(ATTR_NEXT_FIRMWARE)
-        
-        if not current_version or not next_firmware:
-            return False
-            
-        if isinstance(next_firmware, list) and len(next_firmware) > 0:
-            next_version = next_firmware[0].get("version_name")
-            if next_version:
-                try:
-                    # Compare versions using packaging.version
-                    return version.parse(current_version) < version.parse(next_version)
-                except Exception as e:
-                    _LOGGER.warning(
-                        "Error comparing versions %s and %s: %s",
-                        current_version,
-                        next_version,
-                        e
-                    )
-                    return False
-        
-        return False
+        device = self._get_device()
+        return device.firmware.update_available if device else False
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any] | None:
         """Return additional state attributes."""
-        device_data = self._get_device_data()
-        next_firmware = device_data.get(ATTR_NEXT_FIRMWARE)
+        device = self._get_device()
+        if device is None:
+            return None
         
         attributes = {
-            "current_version": device_data.get(ATTR_FIRMWARE_VERSION),
+            "current_version": device.firmware_version,
         }
         
-        if next_firmware and isinstance(next_firmware, list) and len(next_firmware) > 0:
-            firmware_info = next_firmware[0]
+        if firmware_info := device.next_firmware:
             attributes["available_version"] = firmware_info.get("version_name")
             attributes["firmware_file"] = firmware_info.get("file_name")
             attributes["version_code"] = firmware_info.get("version_code")
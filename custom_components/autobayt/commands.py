@@ -0,0 +1,119 @@
+"""Command batching for Autobayt switch triggers."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, List
+
+from .api import AutobaytApiClient
+from .const import COMMAND_BATCH_WINDOW, COMMAND_MAX_CONCURRENCY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _PendingTrigger:
+    """Button states queued for one device within the current window."""
+
+    __slots__ = ("states", "waiters")
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self.states: Dict[int, bool] = {}
+        self.waiters: List[asyncio.Future[None]] = []
+
+
+class AutobaytCommandBatcher:
+    """Merge button commands into one trigger request per device.
+
+    Commands for the same device issued within ``window`` seconds are sent
+    as a single ``DEVICE_TRIGGER_URL`` request; the last state requested for
+    a button wins. At most ``max_concurrency`` devices are triggered at once,
+    and every caller receives the outcome of the request carrying its command.
+    Triggers of one device are sent one after another, so a retried request
+    can never land after the command that overrode it.
+    """
+
+    def __init__(
+        self,
+        api: AutobaytApiClient,
+        window: float = COMMAND_BATCH_WINDOW,
+        max_concurrency: int = COMMAND_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize the batcher."""
+        self._api = api
+        self._window = window
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: Dict[str, _PendingTrigger] = {}
+        self._device_locks: Dict[str, asyncio.Lock] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def async_set_button(self, device_id: str, button_id: int, state: bool) -> None:
+        """Queue a button state and wait for the request carrying it.
+
+        Raises the ``aiohttp.ClientError`` of the failed request, if any.
+        """
+        await self.async_set_buttons(device_id, {button_id: state})
+
+    async def async_set_buttons(self, device_id: str, states: Dict[int, bool]) -> None:
+        """Queue several button states of a device and wait for their request."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        
+        batch = self._pending.get(device_id)
+        if batch is None:
+            batch = self._pending[device_id] = _PendingTrigger()
+            task = asyncio.create_task(self._async_flush(device_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        
+        batch.states.update(states)
+        batch.waiters.append(future)
+        
+        await future
+
+    async def _async_flush(self, device_id: str) -> None:
+        """Send the batch of a device once its window has closed.
+
+        While an earlier trigger of the device is in flight, the batch stays
+        pending and keeps merging new commands until it is its turn.
+        """
+        await asyncio.sleep(self._window)
+        lock = self._device_locks.setdefault(device_id, asyncio.Lock())
+        
+        try:
+            async with lock:
+                batch = self._pending.pop(device_id)
+                button_ids = list(batch.states)
+                states = [batch.states[button_id] for button_id in button_ids]
+                async with self._semaphore:
+                    await self._api.async_trigger(device_id, button_ids, states)
+        except Exception as err:
+            _LOGGER.debug("Trigger for device %s failed: %s", device_id, err)
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+        finally:
+            # A queued batch of the device is still pending and needs the lock
+            if device_id not in self._pending:
+                self._device_locks.pop(device_id, None)
+        
+        if len(batch.waiters) > 1:
+            _LOGGER.debug(
+                "Coalesced %d commands into one trigger for device %s",
+                len(batch.waiters), device_id,
+            )
+        
+        for waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def async_shutdown(self) -> None:
+        """Cancel batches that have not been sent yet."""
+        for task in list(self._tasks):
+            task.cancel()
+        for batch in self._pending.values():
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.cancel()
+        self._pending.clear()
+        self._device_locks.clear()
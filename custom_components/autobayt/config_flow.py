@@ -1,6 +1,7 @@
 """Config flow for Autobayt integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
@@ -10,13 +11,23 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
+from .api import AutobaytApiClient
+from .coordinator import AutobaytCoordinator
+from .decoding import project_device
+from .device_types import get_device_type
 from .const import (
+    CONF_ADOPT_ACTION,
+    CONF_DEVICES,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_POLL_DEADLINE,
     CONF_USER_ID,
-    DEVICE_DETAIL_URL,
-    DEVICE_TYPES,
+    DATA_ACCOUNTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_POLL_DEADLINE,
+    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
-    USER_DEVICE_LIST_URL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -137,15 +148,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         device_data = self._discovered_device
         model_name = device_data.get("model_name", "")
-        device_type_info = self._get_device_type_info(model_name)
+        device_type_info = get_device_type(model_name)
         device_name = device_data.get("name", f"Autobayt {model_name}")
         firmware_version = device_data.get("firmware_version", "Unknown")
         
         device_type_name = "Unknown"
         button_count = 1
         if device_type_info:
-            device_type_name = device_type_info.get("type_info", {}).get("device_type_name", "Unknown")
-            button_count = device_type_info.get("type_info", {}).get("buttons", 1)
+            device_type_name = device_type_info.device_type_name
+            button_count = device_type_info.buttons
         
         # Get connection status
         connection_status = "Online" if device_data.get("connection_status", False) else "Offline"
@@ -165,25 +176,44 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders=placeholders,
         )
 
-    async def async_step_ignore(
-        self, user_input: Dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Ignore the discovered device."""
+    async def async_step_import(self, import_data: Dict[str, Any]) -> FlowResult:
+        """Create a device entry adopted in bulk from the account options."""
+        device_data = import_data["device_data"]
+        
+        await self.async_set_unique_id(import_data["device_id"], raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        
         return self.async_create_entry(
-            title="Ignored Device",
-            data={},
+            title=device_data.get("name", f"Autobayt {device_data.get('model_name', '')}"),
+            data={
+                "device_id": import_data["device_id"],
+                "device_data": device_data,
+                "user_id": import_data.get("user_id"),
+            },
         )
 
+    async def async_step_ignore(
+        self, user_input: Dict[str, Any]
+    ) -> FlowResult:
+        """Ignore the discovered device.
+
+        The ignored entry keeps the device_id as unique_id, so the device is
+        not offered again.
+        """
+        return await super().async_step_ignore(user_input)
+
+    def _get_api_client(self, user_id: str | None = None) -> AutobaytApiClient:
+        """Return the pooled client of a loaded account, or one on the shared HA session."""
+        if user_id:
+            accounts = self.hass.data.get(DOMAIN, {}).get(DATA_ACCOUNTS, {})
+            if coordinator := accounts.get(user_id):
+                return coordinator.api
+        return AutobaytApiClient(async_get_clientsession(self.hass))
+
     async def _async_get_user_devices(self, user_id: str) -> list[Dict[str, Any]] | None:
         """Get devices for user ID."""
-        url = f"{USER_DEVICE_LIST_URL}{user_id}"
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data if isinstance(data, list) else []
+            return await self._get_api_client(user_id).async_get_user_devices(user_id)
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching user devices: %s", err)
             return None
@@ -199,25 +229,24 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             - device_data: Device information dict or None
             - device_exists: False if device was deleted (404), True otherwise
         """
-        url = f"{DEVICE_DETAIL_URL}{device_id}"
+        client = self._get_api_client(self.context.get("user_id"))
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=30) as response:
-                    if response.status == 404:
-                        # Device not found - was deleted
-                        _LOGGER.info("Device %s not found (404)", device_id)
-                        return None, False
-                    
-                    response.raise_for_status()
-                    data = await response.json()
-                    
-                    # Check if response is empty or null (device deleted)
-                    if not data or (isinstance(data, dict) and not data):
-                        _LOGGER.info("Device %s returned empty data", device_id)
-                        return None, False
-                    
-                    return (data if isinstance(data, dict) else None), True
+            data = await client.async_get_device(device_id)
+            
+            # Check if response is empty or null (device deleted)
+            if not data or (isinstance(data, dict) and not data):
+                _LOGGER.info("Device %s returned empty data", device_id)
+                return None, False
+            
+            return (data if isinstance(data, dict) else None), True
+        except aiohttp.ClientResponseError as err:
+            if err.status == 404:
+                # Device not found - was deleted
+                _LOGGER.info("Device %s not found (404)", device_id)
+                return None, False
+            _LOGGER.error("Error fetching device info for %s: %s", device_id, err)
+            return None, True  # Server error, device may still exist
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching device info for %s: %s", device_id, err)
             return None, True  # Network error, device may still exist
@@ -225,13 +254,6 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             _LOGGER.error("Unexpected error fetching device info: %s", err)
             return None, True  # Unknown error, device may still exist
 
-    def _get_device_type_info(self, model_name: str) -> Dict[str, Any] | None:
-        """Get device type information from model name."""
-        for device_type in DEVICE_TYPES:
-            if device_type["device_type_code"] == model_name:
-                return device_type
-        return None
-
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -252,8 +274,95 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: Dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
+        if self._coordinator is not None:
+            return self.async_show_menu(step_id="init", menu_options=["user", "adopt"])
         return await self.async_step_user()
 
+    @property
+    def _coordinator(self) -> AutobaytCoordinator | None:
+        """Return the account coordinator when this is a loaded account entry."""
+        if "device_id" in self.config_entry.data:
+            return None
+        return self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+
+    async def async_step_adopt(
+        self, user_input: Dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add or ignore many devices of the account in one pass."""
+        coordinator = self._coordinator
+        unconfigured = {
+            device["device_id"]: device for device in coordinator.unconfigured_devices()
+        }
+        
+        if user_input is not None:
+            selected = [
+                device_id for device_id in user_input[CONF_DEVICES] if device_id in unconfigured
+            ]
+            if user_input[CONF_ADOPT_ACTION] == "ignore":
+                await self._async_ignore_devices(selected, unconfigured)
+            else:
+                await self._async_add_devices(selected, unconfigured, coordinator)
+            coordinator.async_offer_devices()
+            return self.async_create_entry(title="", data=dict(self.config_entry.options))
+        
+        if not unconfigured:
+            return self.async_abort(reason="no_new_devices")
+        
+        choices = {
+            device_id: f"{device.get('name') or device_id} ({device.get('model_name', '')})"
+            for device_id, device in unconfigured.items()
+        }
+        data_schema = vol.Schema({
+            vol.Required(CONF_DEVICES, default=list(choices)): cv.multi_select(choices),
+            vol.Required(CONF_ADOPT_ACTION, default="add"): vol.In(["add", "ignore"]),
+        })
+        
+        return self.async_show_form(
+            step_id="adopt",
+            data_schema=data_schema,
+            description_placeholders={"count": str(len(choices))},
+        )
+
+    async def _async_add_devices(
+        self,
+        device_ids: list[str],
+        listed: Dict[str, Dict[str, Any]],
+        coordinator: AutobaytCoordinator,
+    ) -> None:
+        """Fetch the selected devices once and create their entries."""
+        details = await coordinator.async_adopt_devices(device_ids)
+        
+        await asyncio.gather(*(
+            self.hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_IMPORT},
+                data={
+                    "device_id": device_id,
+                    "device_data": project_device(details.get(device_id, listed[device_id])),
+                    "user_id": coordinator.user_id,
+                },
+            )
+            for device_id in device_ids
+        ))
+        _LOGGER.info("Adopted %d Autobayt devices", len(device_ids))
+
+    async def _async_ignore_devices(
+        self, device_ids: list[str], listed: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Create ignored entries for the selected devices."""
+        await asyncio.gather(*(
+            self.hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": config_entries.SOURCE_IGNORE},
+                data={
+                    "unique_id": device_id,
+                    "title": listed[device_id].get("name") or device_id,
+                },
+            )
+            for device_id in device_ids
+        ))
+        _LOGGER.info("Ignored %d Autobayt devices", len(device_ids))
+
     async def async_step_user(
         self, user_input: Dict[str, Any] | None = None
     ) -> FlowResult:
@@ -263,8 +372,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        options = self.config_entry.options
+        data_schema = vol.Schema({
+            vol.Optional(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=50)),
+            vol.Optional(
+                CONF_POLL_DEADLINE,
+                default=options.get(CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=DEFAULT_SCAN_INTERVAL)),
+        })
+
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({}),
+            data_schema=data_schema,
             errors=errors,
         )
@@ -4,11 +4,47 @@ from typing import Final
 DOMAIN: Final = "autobayt"
 
 # API Configuration
-USER_DEVICE_LIST_URL: Final = "https://api.autobayt.com/v1/user/get-things?user_id="
-DEVICE_DETAIL_URL: Final = "https://api.autobayt.com/v1/device?device_id="
-DEVICE_TRIGGER_URL: Final = "https://api.autobayt.com/v1/device/trigger"
+API_BASE_URL: Final = "https://api.autobayt.com/v1"
+USER_DEVICE_LIST_PATH: Final = "/user/get-things?user_id="
+DEVICE_DETAIL_PATH: Final = "/device?device_id="
+DEVICE_TRIGGER_PATH: Final = "/device/trigger"
+USER_DEVICE_LIST_URL: Final = f"{API_BASE_URL}{USER_DEVICE_LIST_PATH}"
+DEVICE_DETAIL_URL: Final = f"{API_BASE_URL}{DEVICE_DETAIL_PATH}"
+DEVICE_TRIGGER_URL: Final = f"{API_BASE_URL}{DEVICE_TRIGGER_PATH}"
+
+# HTTP Client
+REQUEST_TIMEOUT: Final = 30  # seconds
+HTTP_CONNECTION_LIMIT: Final = 20
+HTTP_KEEPALIVE_TIMEOUT: Final = 60  # seconds
+HTTP_DNS_CACHE_TTL: Final = 300  # seconds
+HTTP_STREAM_CHUNK_SIZE: Final = 16384  # bytes read per chunk of a streamed body
+DEVICE_CACHE_TTL: Final = 10  # seconds a fetched device payload is reused
+
+# Request Governor
+API_RATE_LIMIT: Final = 5.0  # requests per second per account
+API_BURST: Final = 10
+API_RETRY_ATTEMPTS: Final = 3
+API_RETRY_BASE_DELAY: Final = 0.5  # seconds
+API_RETRY_MAX_DELAY: Final = 8.0  # seconds
+BREAKER_FAILURE_THRESHOLD: Final = 5
+BREAKER_RESET_TIMEOUT: Final = 60  # seconds before a recovery probe
+GLOBAL_MAX_CONCURRENT_REQUESTS: Final = 16  # in flight across all accounts
+
+# Snapshot Storage
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 60  # seconds
+SNAPSHOT_MAX_AGE: Final = 7 * 24 * 3600  # seconds
+
+# Command Batching
+COMMAND_BATCH_WINDOW: Final = 0.05  # seconds
+COMMAND_MAX_CONCURRENCY: Final = 8
+
+# Command Confirmation
+CONFIRM_BACKOFF: Final = (0.5, 1, 2, 4, 8)  # seconds between re-polls
+CONFIRM_DEADLINE: Final = 20  # seconds
 
 # Device Types Configuration
+# Indexed by device_type_code in device_types.DEVICE_TYPE_REGISTRY
 DEVICE_TYPES: Final = [
     {
         "device_type_code": "SW100HV1",
@@ -24,7 +60,8 @@ DEVICE_TYPES: Final = [
         "type_info": {
             "device_type_name": "Smart Switch Single PM",
             "device_generation": "V1",
-            "buttons": 1
+            "buttons": 1,
+            "power_metering": True
         },
         "docs_url": "https://github.com/RASBR/home-assistant-autobayt/wiki/sw100pmv1"
     },
@@ -50,9 +87,33 @@ DEVICE_TYPES: Final = [
 
 # Configuration Keys
 CONF_USER_ID: Final = "user_id"
+CONF_MAX_CONCURRENT_REQUESTS: Final = "max_concurrent_requests"
+CONF_POLL_DEADLINE: Final = "poll_deadline"
+CONF_DEVICES: Final = "devices"
+CONF_ADOPT_ACTION: Final = "action"
+
+# hass.data keys
+DATA_ACCOUNTS: Final = "accounts"
+DATA_ACCOUNTS_LOCK: Final = "accounts_lock"
+DATA_REQUEST_SCHEDULER: Final = "request_scheduler"
 
 # Update Intervals
 DEFAULT_SCAN_INTERVAL: Final = 290  # seconds
+MIN_SCAN_INTERVAL: Final = 5  # seconds
+UPDATING_SCAN_INTERVAL: Final = 10  # seconds, while a firmware update runs
+OFFLINE_MAX_SCAN_INTERVAL: Final = 3600  # seconds, backoff cap for offline devices
+HUB_OFFLINE_PROBE_INTERVAL: Final = 900  # seconds, probe of slaves behind an offline hub
+COMMAND_BURST_INTERVAL: Final = 15  # seconds, after a user command
+COMMAND_BURST_DURATION: Final = 120  # seconds
+
+# Signal Strength History
+SIGNAL_HISTORY_SIZE: Final = 96  # samples kept per device, about 8 hours at the default interval
+WEAK_SIGNAL_THRESHOLD: Final = -75  # dBm; devices with a lower median count as weak
+SIGNAL_HISTORY_FIELD: Final = "signal_history"  # change key of a new signal sample
+
+# Polling Fan-out
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final = 8
+DEFAULT_POLL_DEADLINE: Final = 60  # seconds
 
 # Entity Keys
 ATTR_ROOM_ID: Final = "room_id"
@@ -73,6 +134,24 @@ ATTR_NEXT_FIRMWARE: Final = "next_firmware"
 ATTR_BUTTONS: Final = "buttons"
 ATTR_ROOM_NAME: Final = "room_name"
 
+# Discovery
+DISCOVERY_FLOW_LIMIT: Final = 5  # more new devices than this go to bulk adoption
+ISSUE_NEW_DEVICES: Final = "new_devices"
+ISSUE_DEVICE_REMOVED: Final = "device_removed"
+
+# Account device list fields kept for discovery and entity setup
+DISCOVERY_FIELDS: Final = (
+    "device_id",
+    "name",
+    "model_name",
+    "firmware_version",
+    "connection_status",
+    "is_hub",
+    "slave_id",
+    "room_name",
+    "buttons",
+)
+
 # Button Keys
 BTN_SWITCH_STATE: Final = "switch_state"
 BTN_DPB_STATE: Final = "dpb_state"
@@ -81,3 +160,9 @@ BTN_MODE: Final = "mode"
 BTN_TOGGLE_DELAY: Final = "toggle_delay"
 BTN_NAME: Final = "name"
 BTN_BUTTON_ID: Final = "button_id"
+
+# Services
+SERVICE_SET_BUTTONS: Final = "set_buttons"
+ATTR_TARGETS: Final = "targets"
+ATTR_BUTTON_ID: Final = "button_id"
+ATTR_STATE: Final = "state"
@@ -3,38 +3,93 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import timedelta
 from typing import Any, Dict, List
 
 import aiohttp
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import SOURCE_IGNORE, ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import discovery_flow
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
+from .api import AutobaytApiClient
+from .commands import AutobaytCommandBatcher
+from .device_types import DeviceTypeInfo, get_device_type
+from .governor import AutobaytCircuitOpenError
+from .models import AutobaytDevice
+from .request_scheduler import async_get_request_scheduler
+from .scheduler import AutobaytPollScheduler
+from .signal_history import AutobaytSignalHistory
+from .snapshot import AutobaytSnapshotStore
+from .topology import AutobaytTopology
 from .const import (
+    ATTR_BUTTONS,
+    ATTR_SSTR,
+    BTN_BUTTON_ID,
+    BTN_SWITCH_STATE,
+    CONFIRM_BACKOFF,
+    CONFIRM_DEADLINE,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_POLL_DEADLINE,
     CONF_USER_ID,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_POLL_DEADLINE,
     DEFAULT_SCAN_INTERVAL,
-    DEVICE_DETAIL_URL,
-    DEVICE_TYPES,
+    DEVICE_CACHE_TTL,
+    DISCOVERY_FIELDS,
+    DISCOVERY_FLOW_LIMIT,
     DOMAIN,
-    USER_DEVICE_LIST_URL,
+    ISSUE_DEVICE_REMOVED,
+    ISSUE_NEW_DEVICES,
+    SIGNAL_HISTORY_FIELD,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
 class AutobaytCoordinator(DataUpdateCoordinator):
-    """Autobayt data coordinator."""
+    """Autobayt data coordinator.
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+    One coordinator polls a whole account: the main ``user_id`` entry and every
+    device entry of that account share it. Device entries created without a
+    ``user_id`` fall back to a coordinator of their own.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: AutobaytApiClient | None = None,
+    ) -> None:
         """Initialize the coordinator."""
         self.entry = entry
         self.user_id = entry.data.get(CONF_USER_ID)
-        self.device_id = entry.data.get("device_id")
-        self._session: aiohttp.ClientSession | None = None
+        self.device_id = None if self.user_id else entry.data.get("device_id")
+        self.entry_ids: set[str] = set()
+        self.api = api or AutobaytApiClient(
+            scheduler=async_get_request_scheduler(hass),
+            account=self.user_id or self.device_id or "",
+        )
+        self.commands = AutobaytCommandBatcher(self.api)
         self._discovered_devices: Dict[str, Dict[str, Any]] = {}
+        self._listed_devices: Dict[str, Dict[str, Any]] = {}
         self._added_devices: set[str] = set()
+        self.scheduler = AutobaytPollScheduler()
+        self.topology = AutobaytTopology()
+        self.signal_history = AutobaytSignalHistory()
+        self._next_list_poll = 0.0
+        self._poll_counts = (0, 0)
+        self.device_updated_at: Dict[str, float] = {}
+        self.startup_timings: Dict[str, Dict[str, float]] = {}
+        self._snapshot = AutobaytSnapshotStore(hass, self.user_id or self.device_id)
+        # Last good payload of every monitored device, as written to the snapshot
+        self._snapshot_devices: Dict[str, Dict[str, Any]] = {}
+        self._pending_changes: Dict[str, frozenset[str] | None] | None = None
+        self._last_notified_success = True
+        self._device_info_cache: Dict[str, tuple[tuple[Any, ...], DeviceInfo]] = {}
         
         super().__init__(
             hass,
@@ -44,99 +99,669 @@ class AutobaytCoordinator(DataUpdateCoordinator):
         )
 
     async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from Autobayt API."""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+        """Fetch data from Autobayt API.
+
+        Only devices that the poll scheduler reports as due are fetched;
+        the others keep their previous snapshot. The account device list is
+        refreshed every ``DEFAULT_SCAN_INTERVAL``.
+        """
+        now = time.monotonic()
+        start = time.perf_counter()
+        self._poll_counts = (0, 0)
+        breaker = self.api.governor.breaker
+        
+        if breaker.is_open and breaker.seconds_until_probe() > 0:
+            self._async_reschedule(now)
+            raise UpdateFailed(
+                f"Autobayt API unavailable, polling paused for {breaker.seconds_until_probe():.0f}s"
+            )
+        
+        # Send the recovery probe on its own; the fan-out follows once it succeeds
+        if breaker.is_open:
+            if not await self._async_probe_api():
+                self._async_reschedule(time.monotonic())
+                raise UpdateFailed(
+                    f"Autobayt API still unavailable, next probe in {breaker.seconds_until_probe():.0f}s"
+                )
+            # Devices that failed during the outage need not wait a full interval
+            self.scheduler.retry_failed(now)
         
         try:
-            device_data = {}
-            
             # For device-specific coordinator, fetch device details using Device GET API
             if self.device_id:
-                device = await self._fetch_device_details(self.device_id)
-                if device:
-                    device_data[self.device_id] = device
-                return {"device_data": device_data}
+                device_data = await self._async_poll_devices({self.device_id}, now)
+                result = {
+                    "device_data": device_data,
+                    "devices": self._build_devices(device_data),
+                }
+                self._async_save_snapshot(device_data)
+                return result
             
             # For main coordinator with user_id
             if self.user_id:
-                user_devices = await self._fetch_user_devices()
+                previous_devices = self.data.get("user_devices", []) if self.data else []
+                if self.data and now < self._next_list_poll:
+                    user_devices = previous_devices
+                else:
+                    listed = await self._fetch_user_devices()
+                    self._next_list_poll = now + DEFAULT_SCAN_INTERVAL
+                    if listed is None:
+                        # A failed fetch must not look like every device was removed
+                        user_devices = previous_devices
+                    else:
+                        user_devices = listed
+                        try:
+                            self._async_discover_devices(user_devices)
+                        except Exception as err:
+                            # Flows and repair issues are side effects; the poll goes on
+                            _LOGGER.error("Error reconciling Autobayt devices: %s", err)
                 
                 # Fetch detailed data for each added device using Device GET API
+                device_data = {}
                 if user_devices:
-                    for device_id in self._added_devices:
-                        device = await self._fetch_device_details(device_id)
-                        if device:
-                            device_data[device_id] = device
+                    device_data = await self._async_poll_devices(self._added_devices, now)
                 
-                return {
+                result = {
                     "user_devices": user_devices,
                     "device_data": device_data,
+                    "devices": self._build_devices(device_data),
                 }
+                if user_devices:
+                    self._async_save_snapshot(device_data)
+                return result
             
-            return {"device_data": {}}
+            return {"device_data": {}, "devices": {}}
             
         except Exception as err:
             raise UpdateFailed(f"Error communicating with Autobayt API: {err}") from err
+        finally:
+            self.api.metrics.record_cycle(time.perf_counter() - start, *self._poll_counts)
+            self._async_reschedule(time.monotonic())
+
+    async def _async_poll_devices(self, device_ids: set[str], now: float) -> Dict[str, Dict[str, Any]]:
+        """Fetch the due devices and carry over the snapshot of the others."""
+        previous = self.data.get("device_data", {}) if self.data else {}
+        due = self.scheduler.due_devices(device_ids, now)
+        
+        device_data = {
+            device_id: previous[device_id]
+            for device_id in device_ids - due
+            if device_id in previous
+        }
+        
+        fetched, missed = await self._async_fetch_devices(due)
+        device_data.update(fetched)
+        _carry_over(device_data, previous, missed)
+        # Missed devices are not recorded, so they stay due for the next cycle
+        self._record_fetched(due - missed, fetched, previous, now)
+        
+        went_offline, recovered = self.topology.rebuild(device_data)
+        # An online slave brings its hub back without waiting for the hub's probe
+        answering = self.topology.answering_hubs(fetched)
+        recovered |= answering
+        
+        # Slaves behind an offline hub cannot answer; probe them slowly instead
+        for hub_id in self.topology.offline_hubs - recovered:
+            for slave_id in self.topology.branch(hub_id) & device_ids:
+                if hub_id in went_offline or slave_id in due:
+                    self.scheduler.park(slave_id, now)
+        
+        # A recovered hub brings its whole branch back in one batched refresh
+        branch = (
+            {slave_id for hub_id in recovered for slave_id in self.topology.branch(hub_id)}
+            | answering
+        ) & device_ids - due
+        if branch:
+            _LOGGER.debug("Refreshing %d devices behind recovered hubs", len(branch))
+            refreshed, branch_missed = await self._async_fetch_devices(branch)
+            device_data.update(refreshed)
+            _carry_over(device_data, previous, branch_missed)
+            self._record_fetched(branch - branch_missed, refreshed, previous, now)
+            due |= branch
+            missed |= branch_missed
+            if answering:
+                self.topology.rebuild(device_data)
+        
+        self._pending_changes = _diff_device_data(previous, device_data)
+        
+        self._poll_counts = (len(due - missed), len(device_ids) - len(due - missed))
+        _LOGGER.debug("Poll cycle refreshed %d devices, skipped %d", *self._poll_counts)
+        return device_data
+
+    def _record_fetched(
+        self,
+        device_ids: set[str],
+        fetched: Dict[str, Dict[str, Any]],
+        previous: Dict[str, Dict[str, Any]],
+        now: float,
+    ) -> None:
+        """Schedule the next poll of fetched devices and record fresh payloads."""
+        wall_time = time.time()
+        for device_id in device_ids:
+            self.scheduler.record(device_id, fetched.get(device_id), now)
+            if device_id in fetched and fetched[device_id] is not previous.get(device_id):
+                self.device_updated_at[device_id] = wall_time
+                self.signal_history.record(device_id, fetched[device_id].get(ATTR_SSTR))
+
+    async def async_restore_snapshot(self) -> bool:
+        """Populate the coordinator from the last saved snapshot.
+
+        Returns True if a usable snapshot was found; a live refresh should
+        then reconcile it in the background.
+        """
+        snapshot = await self._snapshot.async_load()
+        if snapshot is None:
+            return False
+        
+        device_data: Dict[str, Dict[str, Any]] = snapshot["device_data"]
+        self.device_updated_at.update(snapshot.get("updated_at", {}))
+        self._snapshot_devices.update(device_data)
+        
+        data: Dict[str, Any] = {
+            "device_data": device_data,
+            "devices": {
+                device_id: AutobaytDevice(device_id, payload)
+                for device_id, payload in device_data.items()
+            },
+        }
+        if self.user_id:
+            data["user_devices"] = snapshot.get("user_devices", [])
+        
+        _LOGGER.debug(
+            "Restored %d devices from snapshot saved %.0fs ago",
+            len(device_data), time.time() - snapshot.get("saved_at", 0),
+        )
+        self.async_set_updated_data(data)
+        return True
+
+    @callback
+    def _async_save_snapshot(self, device_data: Dict[str, Dict[str, Any]]) -> None:
+        """Merge the payloads of a poll into the snapshot and schedule a write.
+
+        Devices whose fetch failed are missing from ``device_data``; they keep
+        their last good payload and fetch time, so an outage cannot empty the
+        snapshot a restart would restore from.
+        """
+        self._snapshot_devices.update(device_data)
+        self._snapshot.async_schedule_save(self._snapshot_data)
+
+    @callback
+    def _snapshot_data(self) -> Dict[str, Any]:
+        """Return the compact document written to the snapshot store."""
+        data = self.data or {}
+        # Copied, since the store serializes it outside the event loop
+        device_data = dict(self._snapshot_devices)
+        return {
+            "saved_at": time.time(),
+            "user_devices": [
+                {key: device[key] for key in DISCOVERY_FIELDS if key in device}
+                for device in data.get("user_devices", [])
+            ],
+            "device_data": device_data,
+            "updated_at": {
+                device_id: updated_at
+                for device_id, updated_at in self.device_updated_at.items()
+                if device_id in device_data
+            },
+        }
+
+    @property
+    def data_age(self) -> float | None:
+        """Return seconds since the oldest monitored device was last fetched."""
+        timestamps = [
+            self.device_updated_at[device_id]
+            for device_id in self.devices
+            if device_id in self.device_updated_at
+        ]
+        if not timestamps:
+            return None
+        return time.time() - min(timestamps)
+
+    def _build_devices(self, device_data: Dict[str, Dict[str, Any]]) -> Dict[str, AutobaytDevice]:
+        """Parse payloads into device records, reusing records of unchanged devices."""
+        previous = self.devices
+        changes = self._pending_changes
+        
+        devices: Dict[str, AutobaytDevice] = {}
+        for device_id, payload in device_data.items():
+            if changes is not None and device_id not in changes and device_id in previous:
+                devices[device_id] = previous[device_id]
+            else:
+                devices[device_id] = AutobaytDevice(device_id, payload)
+        return devices
+
+    def get_account_device_info(self) -> DeviceInfo:
+        """Return the DeviceInfo of the account service device."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.user_id or self.device_id)},
+            name="Autobayt Account",
+            manufacturer="Autobayt",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def devices(self) -> Dict[str, AutobaytDevice]:
+        """Return the parsed device records of the last poll."""
+        if not self.data:
+            return {}
+        return self.data.get("devices", {})
+
+    @property
+    def registered_devices(self) -> frozenset[str]:
+        """Return the monitored device_ids, including devices not fetched yet."""
+        return frozenset(self._added_devices)
+
+    def get_device(self, device_id: str) -> AutobaytDevice | None:
+        """Return the parsed record of a device."""
+        return self.devices.get(device_id)
+
+    def get_device_info(self, device_id: str, device_name: str) -> DeviceInfo:
+        """Return the DeviceInfo shared by all entities of a device.
+
+        The object is rebuilt only when the name, model, firmware or hub
+        relationship of the device changes.
+        """
+        device = self.get_device(device_id)
+        key = (
+            device_name,
+            device.model_name if device else None,
+            device.firmware_version if device else None,
+            device.is_hub if device else False,
+            device.slave_id if device else "",
+        )
+        
+        cached = self._device_info_cache.get(device_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        _, model_name, firmware_version, is_hub, slave_id = key
+        info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=device_name,
+            manufacturer="Autobayt",
+            model=model_name or "Unknown",
+            sw_version=firmware_version or "Unknown",
+            connections={("mac", device_id)},
+        )
+        
+        # Add via_device for slave devices connected to a hub
+        if not is_hub and slave_id:
+            info["via_device"] = (DOMAIN, slave_id)
+        
+        self._device_info_cache[device_id] = (key, info)
+        return info
+
+    @callback
+    def _async_reschedule(self, now: float) -> None:
+        """Set the next refresh to when the earliest device is due."""
+        extra_due = (self._next_list_poll,) if self.user_id else ()
+        interval = self.scheduler.next_wakeup(now, *extra_due)
+        
+        # While the circuit breaker is open, wake up for the recovery probe only
+        breaker = self.api.governor.breaker
+        if breaker.is_open:
+            interval = min(
+                max(interval, breaker.seconds_until_probe()), DEFAULT_SCAN_INTERVAL
+            )
+        
+        self.update_interval = timedelta(seconds=interval)
 
-    async def _fetch_user_devices(self) -> List[Dict[str, Any]]:
-        """Fetch all devices for the user."""
+    async def _async_fetch_devices(
+        self, device_ids: set[str], max_age: float = 0
+    ) -> tuple[Dict[str, Dict[str, Any]], set[str]]:
+        """Fetch details for several devices concurrently.
+
+        At most ``max_concurrent_requests`` fetches are in flight at once and
+        the whole batch must finish within ``poll_deadline`` seconds. Devices
+        are started longest-overdue first, so when the rate limit keeps a
+        large batch from finishing, the next cycle continues with the devices
+        that missed out instead of starving the same tail every time.
+
+        Polls always ask the API; pass ``max_age`` to accept cached payloads.
+
+        Returns:
+            Tuple of (fetched payloads, device_ids that were not polled).
+            Devices that missed the deadline are cancelled; like devices
+            rejected by an open circuit breaker, they should stay due.
+        """
+        if not device_ids:
+            return {}, set()
+        
+        semaphore = asyncio.Semaphore(
+            self._get_option(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+        deadline = self._get_option(CONF_POLL_DEADLINE, DEFAULT_POLL_DEADLINE)
+        
+        async def _fetch(device_id: str) -> Dict[str, Any] | None:
+            async with semaphore:
+                return await self._fetch_device_details(device_id, max_age)
+        
+        tasks = {
+            asyncio.create_task(_fetch(device_id)): device_id
+            for device_id in self.scheduler.stalest_first(device_ids)
+        }
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        
+        device_data: Dict[str, Dict[str, Any]] = {}
+        rejected: set[str] = set()
+        for task in done:
+            if isinstance(task.exception(), AutobaytCircuitOpenError):
+                rejected.add(tasks[task])
+                continue
+            if task.exception():
+                _LOGGER.error(
+                    "Error fetching device details for %s: %s", tasks[task], task.exception()
+                )
+                continue
+            if device := task.result():
+                device_data[tasks[task]] = device
+        
+        missed = {tasks[task] for task in pending}
+        if pending:
+            # Cancelling the last waiter also cancels the shared HTTP request
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+            _LOGGER.warning(
+                "%d of %d device fetches missed the %ss poll deadline, keeping previous data",
+                len(pending), len(tasks), deadline,
+            )
+        if rejected:
+            _LOGGER.debug(
+                "%d device fetches skipped while the API is paused", len(rejected)
+            )
+        
+        return device_data, missed | rejected
+
+    def _get_option(self, key: str, default: Any) -> Any:
+        """Return an option set on any config entry of this account."""
+        for entry in self.hass.config_entries.async_entries(DOMAIN):
+            if entry.entry_id in self.entry_ids and key in entry.options:
+                return entry.options[key]
+        return default
+
+    async def _async_probe_api(self) -> bool:
+        """Send the single request allowed while the circuit breaker is open.
+
+        The longest-overdue device serves as the probe, or the account
+        device list if no device is monitored yet.
+
+        Returns:
+            True if the API answered and the breaker closed again.
+        """
+        monitored = {self.device_id} if self.device_id else self._added_devices
+        if candidates := self.scheduler.stalest_first(monitored):
+            try:
+                await self._fetch_device_details(candidates[0], max_age=0)
+            except AutobaytCircuitOpenError:
+                return False
+        elif self.user_id:
+            await self._fetch_user_devices()
+        return not self.api.governor.breaker.is_open
+
+    async def _fetch_user_devices(self) -> List[Dict[str, Any]] | None:
+        """Fetch all devices for the user, or None if the request failed."""
         if not self.user_id:
             return []
             
         return await self._fetch_user_devices_by_id(self.user_id)
 
-    async def _fetch_user_devices_by_id(self, user_id: str) -> List[Dict[str, Any]]:
+    async def _fetch_user_devices_by_id(self, user_id: str) -> List[Dict[str, Any]] | None:
         """Fetch all devices for a specific user_id."""
-        url = f"{USER_DEVICE_LIST_URL}{user_id}"
-        
         try:
-            async with self._session.get(url, timeout=30) as response:
-                response.raise_for_status()
-                data = await response.json()
-                return data if isinstance(data, list) else []
+            return await self.api.async_get_user_devices(user_id)
+        except AutobaytCircuitOpenError as err:
+            _LOGGER.debug("Skipping device list fetch: %s", err)
+            return None
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching user devices: %s", err)
-            return []
+            return None
 
-    async def _fetch_device_details(self, device_id: str) -> Dict[str, Any] | None:
-        """Fetch detailed information for a specific device."""
-        url = f"{DEVICE_DETAIL_URL}{device_id}"
-        
+    async def _fetch_device_details(
+        self, device_id: str, max_age: float = DEVICE_CACHE_TTL
+    ) -> Dict[str, Any] | None:
+        """Fetch detailed information for a specific device.
+
+        Payloads younger than ``max_age`` seconds come from the client's
+        detail cache, e.g. right after a config flow fetched the device.
+
+        Raises:
+            AutobaytCircuitOpenError: The request was not sent because the
+                circuit breaker is open; the device was not actually polled.
+        """
         try:
-            async with self._session.get(url, timeout=30) as response:
-                response.raise_for_status()
-                data = await response.json()
-                _LOGGER.debug("API response for device %s: %s", device_id, data)
-                # API returns a single device object
-                if isinstance(data, dict):
-                    _LOGGER.debug("Returning dict device data for %s", device_id)
-                    return data
-                _LOGGER.warning("Unexpected data type for device %s: %s", device_id, type(data))
-                return None
-        except aiohttp.ClientError as err:
+            data = await self.api.async_get_device(device_id, max_age)
+            _LOGGER.debug("API response for device %s: %s", device_id, data)
+            # API returns a single device object
+            if isinstance(data, dict):
+                _LOGGER.debug("Returning dict device data for %s", device_id)
+                return data
+            _LOGGER.warning("Unexpected data type for device %s: %s", device_id, type(data))
+            return None
+        except AutobaytCircuitOpenError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
             _LOGGER.error("Error fetching device details for %s: %s", device_id, err)
             return None
 
-    async def async_start_discovery(self) -> None:
-        """Start the device discovery process."""
-        await self._async_discover_devices()
+    async def async_confirm_buttons(self, device_id: str, expected: Dict[int, bool]) -> bool:
+        """Re-poll a single device until its buttons report the expected states.
 
-    async def _async_discover_devices(self) -> None:
-        """Discover new devices and create discovery flows."""
-        if not self.data or "user_devices" not in self.data:
+        Polls follow ``CONFIRM_BACKOFF`` until the states match or
+        ``CONFIRM_DEADLINE`` passes, including the time spent in requests.
+        Every fetched payload is published to listeners, so on a mismatch
+        entities fall back to the reported state.
+        """
+        deadline = time.monotonic() + CONFIRM_DEADLINE
+        self.async_boost_device(device_id)
+        
+        try:
+            async with asyncio.timeout(CONFIRM_DEADLINE):
+                for delay in CONFIRM_BACKOFF:
+                    if time.monotonic() + delay > deadline:
+                        break
+                    await asyncio.sleep(delay)
+                    
+                    # Confirmation needs what the device reports now, never a cached payload
+                    try:
+                        device = await self._fetch_device_details(device_id, max_age=0)
+                    except AutobaytCircuitOpenError:
+                        continue
+                    if device is None:
+                        continue
+                    
+                    self.async_set_device_data(device_id, device)
+                    
+                    reported = {
+                        button.get(BTN_BUTTON_ID): button.get(BTN_SWITCH_STATE)
+                        for button in device.get(ATTR_BUTTONS, [])
+                    }
+                    if all(reported.get(button_id) is state for button_id, state in expected.items()):
+                        return True
+        except TimeoutError:
+            _LOGGER.debug("Confirmation of device %s timed out", device_id)
+        
+        return False
+
+    async def async_refresh_devices(self, device_ids: set[str]) -> None:
+        """Fetch several devices in one fan-out and notify listeners once.
+
+        Used after bulk commands; the devices are then boosted like after a
+        switch command so late state changes are still picked up.
+        """
+        if self.data is None or not device_ids:
+            return
+        
+        now = time.monotonic()
+        previous = self.data.get("device_data", {})
+        fetched, missed = await self._async_fetch_devices(device_ids)
+        self._record_fetched(device_ids - missed, fetched, previous, now)
+        for device_id in device_ids:
+            self.scheduler.boost(device_id, now)
+        
+        device_data = {**previous, **fetched}
+        self._pending_changes = _diff_device_data(previous, device_data)
+        self.data["devices"] = self._build_devices(device_data)
+        self.data["device_data"] = device_data
+        self._async_reschedule(now)
+        self.async_update_listeners()
+
+    @callback
+    def async_boost_device(self, device_id: str) -> None:
+        """Poll a device quickly for a short while after a user command."""
+        now = time.monotonic()
+        self.scheduler.boost(device_id, now)
+        self._async_reschedule(now)
+        if self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def async_set_device_data(self, device_id: str, device: Dict[str, Any]) -> None:
+        """Replace the snapshot of one device and notify listeners."""
+        if self.data is None:
             return
+        
+        device_data = self.data.setdefault("device_data", {})
+        self._pending_changes = _diff_device_data(
+            {device_id: device_data[device_id]} if device_id in device_data else {},
+            {device_id: device},
+        )
+        device_data[device_id] = device
+        self.data.setdefault("devices", {})[device_id] = AutobaytDevice(device_id, device)
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose device fields changed.
 
-        user_devices = self.data["user_devices"]
+        Entities subscribe with a ``(device_id, fields)`` context, where
+        ``fields`` is the set of payload keys they render. Listeners without
+        a context, and all listeners after an availability change or an
+        unknown diff, are always notified. Devices with a new signal sample
+        also report ``SIGNAL_HISTORY_FIELD`` as changed.
+        """
+        changes = self._pending_changes
+        self._pending_changes = None
+        recorded = self.signal_history.pop_recorded()
         
-        for device in user_devices:
-            device_id = device.get("device_id")
-            if not device_id:
+        if changes is None or self.last_update_success != self._last_notified_success:
+            self._last_notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        
+        for device_id in recorded:
+            if device_id not in changes:
+                changes[device_id] = frozenset({SIGNAL_HISTORY_FIELD})
+            elif changes[device_id] is not None:
+                changes[device_id] |= {SIGNAL_HISTORY_FIELD}
+        
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
                 continue
-                
-            if device_id in self._discovered_devices:
+            
+            device_id, fields = context
+            if device_id not in changes:
                 continue
-                
+            
+            changed_fields = changes[device_id]
+            if changed_fields is None or fields is None or not fields.isdisjoint(changed_fields):
+                update_callback()
+
+    async def async_start_discovery(self) -> None:
+        """Start the device discovery process."""
+        if not self.data or "user_devices" not in self.data:
+            return
+        
+        self._async_discover_devices(self.data["user_devices"])
+
+    @callback
+    def _async_discover_devices(self, user_devices: List[Dict[str, Any]]) -> None:
+        """Reconcile the account device list with the known devices.
+
+        Runs on every device list poll. The device IDs are compared with the
+        previous list as sets, so an unchanged account costs one set
+        comparison and touches neither config entries nor flows. The first
+        list after startup, and every changed one, is also compared with the
+        configured device entries of the account, so devices deleted while
+        Home Assistant was down are flagged as well.
+        """
+        listed = {
+            device["device_id"]: device for device in user_devices if device.get("device_id")
+        }
+        previous = self._listed_devices
+        self._listed_devices = listed
+        
+        if previous and listed.keys() == previous.keys():
+            return
+        
+        entries = self._device_entries()
+        configured = {
+            device_id
+            for device_id, entry in entries.items()
+            if entry.data.get("device_id") and entry.data.get(CONF_USER_ID) == self.user_id
+        }
+        added = listed.keys() - previous.keys()
+        removed = (previous.keys() | configured) - listed.keys()
+        
+        for device_id in added:
+            # A device that came back no longer needs its removal flagged
+            ir.async_delete_issue(self.hass, DOMAIN, f"{ISSUE_DEVICE_REMOVED}_{device_id}")
+        
+        for device_id in removed:
+            self._async_handle_removed_device(device_id, entries.get(device_id))
+        
+        if added:
+            self.async_offer_devices()
+
+    def _device_entries(self) -> Dict[str, ConfigEntry]:
+        """Return the config entries of this domain by device_id, ignored ones included."""
+        return {
+            entry.unique_id: entry
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.unique_id
+        }
+
+    def unconfigured_devices(self) -> List[Dict[str, Any]]:
+        """Return the listed devices that have no config entry yet."""
+        entries = self._device_entries()
+        return [
+            device
+            for device_id, device in self._listed_devices.items()
+            if device_id not in entries
+        ]
+
+    @callback
+    def async_offer_devices(self) -> None:
+        """Offer unconfigured devices through discovery or bulk adoption.
+
+        Up to ``DISCOVERY_FLOW_LIMIT`` new devices get a discovery flow each.
+        Beyond that a single repair issue points to the bulk adoption step
+        of the account options instead.
+        """
+        pending = [
+            device
+            for device in self.unconfigured_devices()
+            if device["device_id"] not in self._discovered_devices
+        ]
+        issue_id = f"{ISSUE_NEW_DEVICES}_{self.user_id}"
+        
+        if len(pending) > DISCOVERY_FLOW_LIMIT:
+            ir.async_create_issue(
+                self.hass,
+                DOMAIN,
+                issue_id,
+                is_fixable=False,
+                severity=ir.IssueSeverity.WARNING,
+                translation_key=ISSUE_NEW_DEVICES,
+                translation_placeholders={"count": str(len(pending))},
+            )
+            return
+        
+        ir.async_delete_issue(self.hass, DOMAIN, issue_id)
+        
+        for device in pending:
+            device_id = device["device_id"]
             self._discovered_devices[device_id] = device
             
             discovery_flow.async_create_flow(
@@ -153,26 +778,104 @@ class AutobaytCoordinator(DataUpdateCoordinator):
             _LOGGER.info("Discovered Autobayt device: %s (%s)", 
                         device.get("name", "Unknown"), device_id)
 
+    @callback
+    def _async_handle_removed_device(self, device_id: str, entry: ConfigEntry | None) -> None:
+        """Clean up after a device that disappeared from the account."""
+        _LOGGER.info("Autobayt device %s is no longer listed in the account", device_id)
+        self._discovered_devices.pop(device_id, None)
+        
+        for flow in self.hass.config_entries.flow.async_progress_by_handler(
+            DOMAIN, match_context={"unique_id": device_id}
+        ):
+            self.hass.config_entries.flow.async_abort(flow["flow_id"])
+        
+        if entry is None:
+            return
+        
+        if entry.source == SOURCE_IGNORE:
+            self.hass.async_create_task(self.hass.config_entries.async_remove(entry.entry_id))
+            return
+        
+        ir.async_create_issue(
+            self.hass,
+            DOMAIN,
+            f"{ISSUE_DEVICE_REMOVED}_{device_id}",
+            data={"entry_id": entry.entry_id},
+            is_fixable=True,
+            severity=ir.IssueSeverity.WARNING,
+            translation_key=ISSUE_DEVICE_REMOVED,
+            translation_placeholders={"name": entry.title, "device_id": device_id},
+        )
+
+    async def async_adopt_devices(self, device_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the details of devices about to be added, in one bounded batch.
+
+        The payloads are published right away so the new entries find their
+        data at setup instead of fetching each device again.
+        """
+        now = time.monotonic()
+        fetched, _ = await self._async_fetch_devices(set(device_ids), DEVICE_CACHE_TTL)
+        wall_time = time.time()
+        
+        for device_id, device in fetched.items():
+            self.scheduler.record(device_id, device, now)
+            self.device_updated_at[device_id] = wall_time
+            self.async_set_device_data(device_id, device)
+        
+        return fetched
+
     async def async_add_device(self, device_id: str) -> None:
         """Add a device to be monitored."""
+        self.register_device(device_id)
+        await self.async_ensure_device(device_id)
+
+    @callback
+    def register_device(self, device_id: str) -> None:
+        """Add a device to be monitored without fetching it."""
         self._added_devices.add(device_id)
-        await self.async_request_refresh()
+
+    async def async_ensure_device(self, device_id: str) -> None:
+        """Fetch a registered device unless a poll or snapshot already covers it."""
+        if self.scheduler.is_scheduled(device_id) or device_id in self.devices:
+            return
+        await self.async_refresh_device(device_id)
+
+    async def async_refresh_device(self, device_id: str) -> None:
+        """Fetch a single device and publish its payload.
+
+        Errors are logged rather than raised; the regular poll retries.
+        """
+        now = time.monotonic()
+        try:
+            device = await self._fetch_device_details(device_id)
+        except AutobaytCircuitOpenError as err:
+            _LOGGER.debug("Skipping fetch of device %s: %s", device_id, err)
+            return
+        except Exception as err:
+            _LOGGER.error("Unexpected error fetching device %s: %s", device_id, err)
+            return
+        self.scheduler.record(device_id, device, now)
+        if device is not None:
+            self.device_updated_at[device_id] = time.time()
+            self.signal_history.record(device_id, device.get(ATTR_SSTR))
+            self.async_set_device_data(device_id, device)
 
     async def async_remove_device(self, device_id: str) -> None:
         """Remove a device from monitoring."""
         self._added_devices.discard(device_id)
+        self.scheduler.remove(device_id)
+        self._device_info_cache.pop(device_id, None)
+        self._snapshot_devices.pop(device_id, None)
+        self.signal_history.remove(device_id)
 
     def reset_device_discovery(self, device_id: str) -> None:
         """Reset device discovery status to allow rediscovery."""
         self._discovered_devices.pop(device_id, None)
         _LOGGER.debug("Reset discovery for device: %s", device_id)
 
-    def get_device_type_info(self, model_name: str) -> Dict[str, Any] | None:
+    def get_device_type_info(self, model_name: str) -> DeviceTypeInfo | None:
         """Get device type information from model name."""
-        for device_type in DEVICE_TYPES:
-            if device_type["device_type_code"] == model_name:
-                return device_type
-        return None
+        return get_device_type(model_name)
 
     def get_discovered_device(self, device_id: str) -> Dict[str, Any] | None:
         """Get discovered device data."""
@@ -180,6 +883,49 @@ class AutobaytCoordinator(DataUpdateCoordinator):
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and cleanup resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        if self.entry_ids:
+            # Still in use by other entries of the same account
+            return
+
+        await super().async_shutdown()
+        await self.commands.async_shutdown()
+        await self.api.async_close()
+
+
+def _carry_over(
+    device_data: Dict[str, Dict[str, Any]],
+    previous: Dict[str, Dict[str, Any]],
+    device_ids: set[str],
+) -> None:
+    """Keep the previous snapshot of devices that were not fetched."""
+    for device_id in device_ids:
+        if device_id in previous:
+            device_data[device_id] = previous[device_id]
+
+
+def _diff_device_data(
+    previous: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]]
+) -> Dict[str, frozenset[str] | None]:
+    """Return the changed payload keys per device.
+
+    A value of None means the device appeared or disappeared. Snapshots that
+    were carried over unchanged are the same object and skipped cheaply.
+    """
+    changes: Dict[str, frozenset[str] | None] = {}
+    
+    for device_id in previous.keys() | current.keys():
+        old = previous.get(device_id)
+        new = current.get(device_id)
+        if old is new:
+            continue
+        if old is None or new is None:
+            changes[device_id] = None
+            continue
+        
+        fields = frozenset(
+            key for key in old.keys() | new.keys() if old.get(key) != new.get(key)
+        )
+        if fields:
+            changes[device_id] = fields
+    
+    return changes
@@ -0,0 +1,97 @@
+"""Incremental decoding of the Autobayt account device list."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence
+
+from homeassistant.util.json import json_loads
+
+from .const import DISCOVERY_FIELDS
+
+try:
+    import ijson
+except ImportError:  # optional streaming backend
+    ijson = None
+
+HAS_STREAMING_BACKEND = ijson is not None
+
+
+def project_device(device: Any, fields: Sequence[str] = DISCOVERY_FIELDS) -> Dict[str, Any] | None:
+    """Return only the listed fields of a device payload."""
+    if not isinstance(device, dict):
+        return None
+    return {key: device[key] for key in fields if key in device}
+
+
+class DeviceListDecoder:
+    """Decode a ``get-things`` body chunk by chunk.
+
+    With ``ijson`` installed, each device is parsed as soon as its bytes
+    arrive and reduced to ``fields`` before the next one is read, so the
+    full account list never exists in memory. Without it, the chunks are
+    joined and decoded with Home Assistant's JSON backend, and only the
+    projected devices are kept afterwards.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] = DISCOVERY_FIELDS,
+        streaming: bool = HAS_STREAMING_BACKEND,
+    ) -> None:
+        """Initialize the decoder."""
+        self._fields = fields
+        self.devices: List[Dict[str, Any]] = []
+        self.size = 0
+        self._has_content = False
+        self._chunks: List[bytes] = []
+        self._items: Any = None
+        self._parser: Any = None
+        if streaming and ijson is not None:
+            self._items = ijson.sendable_list()
+            self._parser = ijson.items_coro(self._items, "item", use_float=True)
+
+    def feed(self, chunk: bytes) -> None:
+        """Consume the next chunk of the response body."""
+        self.size += len(chunk)
+        self._has_content = self._has_content or bool(chunk.strip())
+        if self._parser is None:
+            self._chunks.append(chunk)
+            return
+        try:
+            self._parser.send(chunk)
+        except ijson.JSONError as err:
+            raise ValueError(f"Invalid device list: {err}") from err
+        self._drain()
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Finish decoding and return the projected devices.
+
+        A body that is empty or not a JSON list yields no devices.
+        """
+        if self._parser is not None:
+            if not self._has_content:
+                return self.devices
+            try:
+                self._parser.close()
+            except ijson.JSONError as err:
+                raise ValueError(f"Invalid device list: {err}") from err
+            self._drain()
+            return self.devices
+
+        body = b"".join(self._chunks)
+        self._chunks.clear()
+        data = json_loads(body) if self._has_content else None
+        if isinstance(data, list):
+            self._extend(data)
+        return self.devices
+
+    def _drain(self) -> None:
+        """Project the devices parsed so far and release the raw items."""
+        if self._items:
+            self._extend(self._items)
+            del self._items[:]
+
+    def _extend(self, items: List[Any]) -> None:
+        """Append the projection of each device payload."""
+        for item in items:
+            if (device := project_device(item, self._fields)) is not None:
+                self.devices.append(device)
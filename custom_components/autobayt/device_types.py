@@ -0,0 +1,48 @@
+"""Device type catalog for Autobayt."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from .const import DEVICE_TYPES
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceTypeInfo:
+    """Capabilities of an Autobayt device model."""
+
+    device_type_code: str
+    device_type_name: str
+    device_generation: str
+    buttons: int
+    power_metering: bool
+    docs_url: str | None
+
+
+def _build_registry(device_types: list[Dict[str, Any]]) -> Mapping[str, DeviceTypeInfo]:
+    """Index the DEVICE_TYPES entries by device_type_code."""
+    registry: Dict[str, DeviceTypeInfo] = {}
+    for device_type in device_types:
+        type_info = device_type.get("type_info", {})
+        code = device_type["device_type_code"]
+        registry[code] = DeviceTypeInfo(
+            device_type_code=code,
+            device_type_name=type_info.get("device_type_name", "Unknown"),
+            device_generation=type_info.get("device_generation", ""),
+            buttons=type_info.get("buttons", 1),
+            power_metering=type_info.get("power_metering", False),
+            docs_url=device_type.get("docs_url"),
+        )
+    return MappingProxyType(registry)
+
+
+# Built once at import; new models only need an entry in DEVICE_TYPES
+DEVICE_TYPE_REGISTRY: Mapping[str, DeviceTypeInfo] = _build_registry(DEVICE_TYPES)
+
+
+def get_device_type(model_name: str | None) -> DeviceTypeInfo | None:
+    """Return the capabilities of a model, or None if it is not known."""
+    if not model_name:
+        return None
+    return DEVICE_TYPE_REGISTRY.get(model_name)
@@ -0,0 +1,45 @@
+"""Diagnostics support for Autobayt."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_USER_ID, DOMAIN
+from .coordinator import AutobaytCoordinator
+
+TO_REDACT = {CONF_USER_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AutobaytCoordinator = hass.data[DOMAIN][entry.entry_id]
+    breaker = coordinator.api.governor.breaker
+    
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "entries": len(coordinator.entry_ids),
+            "devices": len(coordinator.devices),
+            "circuit_open": breaker.is_open,
+            "seconds_until_probe": round(breaker.seconds_until_probe(), 1),
+            "data_age": coordinator.data_age,
+            "device_updated_at": dict(coordinator.device_updated_at),
+            "startup_timings": coordinator.startup_timings.get(entry.entry_id),
+            "topology": coordinator.topology.as_dict(),
+            "signal": coordinator.signal_history.fleet_summary(),
+        },
+        "metrics": coordinator.api.metrics.as_dict(),
+        "request_scheduler": coordinator.api.scheduler.as_dict()
+        if coordinator.api.scheduler
+        else None,
+    }
@@ -0,0 +1,63 @@
+"""Firmware version comparison for Autobayt."""
+from __future__ import annotations
+
+from functools import lru_cache
+import logging
+
+from packaging import version
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FirmwareInfo:
+    """Result of comparing an installed and an offered firmware version."""
+
+    __slots__ = (
+        "installed_version",
+        "available_version",
+        "installed_parsed",
+        "available_parsed",
+        "update_available",
+        "latest_version",
+    )
+
+    def __init__(self, installed_version: str | None, available_version: str | None) -> None:
+        """Parse and compare both versions."""
+        self.installed_version = installed_version
+        self.available_version = available_version
+        self.installed_parsed = _parse(installed_version)
+        self.available_parsed = _parse(available_version)
+
+        if not installed_version or not available_version:
+            self.update_available = False
+        elif self.installed_parsed is not None and self.available_parsed is not None:
+            self.update_available = self.installed_parsed < self.available_parsed
+        else:
+            _LOGGER.warning(
+                "Error comparing versions %s and %s, falling back to string comparison",
+                installed_version,
+                available_version,
+            )
+            self.update_available = installed_version != available_version
+
+        self.latest_version = available_version if self.update_available else installed_version
+
+
+@lru_cache(maxsize=256)
+def get_firmware_info(installed_version: str | None, available_version: str | None) -> FirmwareInfo:
+    """Return the shared comparison result for a version pair.
+
+    Devices on the same firmware share one entry, so each distinct pair is
+    parsed once and the binary sensor and update platforms always agree.
+    """
+    return FirmwareInfo(installed_version, available_version)
+
+
+def _parse(value: str | None) -> version.Version | None:
+    """Parse a version string, returning None if it is missing or invalid."""
+    if not value:
+        return None
+    try:
+        return version.parse(value)
+    except version.InvalidVersion:
+        return None
@@ -0,0 +1,184 @@
+"""Rate limiting, retries and circuit breaking for the Autobayt API."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import aiohttp
+
+from .const import (
+    API_BURST,
+    API_RATE_LIMIT,
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+class AutobaytCircuitOpenError(aiohttp.ClientError):
+    """Raised instead of calling the API while the circuit breaker is open.
+
+    Subclasses ``aiohttp.ClientError`` so existing error handling treats it
+    like any other failed request.
+    """
+
+
+class TokenBucket:
+    """Token bucket limiting the request rate of an account."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """Initialize a full bucket."""
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def async_acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class CircuitBreaker:
+    """Stop calling a failing API and probe recovery with a single request.
+
+    After ``failure_threshold`` consecutive failures the breaker opens. Once
+    ``reset_timeout`` has passed, exactly one request is let through; its
+    outcome closes the breaker again or restarts the timeout.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being rejected."""
+        return self._opened_at is not None
+
+    def seconds_until_probe(self) -> float:
+        """Return how long until a recovery probe is allowed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self._opened_at is None:
+            return True
+        if self._probing or self.seconds_until_probe() > 0:
+            return False
+        self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Allow a new probe after the current one was cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the breaker after a healthy response."""
+        if self._opened_at is not None:
+            _LOGGER.info("Autobayt API recovered, resuming requests")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure and open the breaker past the threshold."""
+        self._failures += 1
+        if self._probing or (
+            self._opened_at is None and self._failures >= self._failure_threshold
+        ):
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Autobayt API failed %d times in a row, pausing requests for %ss",
+                    self._failures, self._reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+
+class AutobaytRequestGovernor:
+    """Apply the rate limit, retry policy and circuit breaker to API calls."""
+
+    def __init__(self) -> None:
+        """Initialize the governor with the account defaults."""
+        self.bucket = TokenBucket(API_RATE_LIMIT, API_BURST)
+        self.breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_TIMEOUT)
+
+    async def async_call(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Run a request, retrying transient errors with jittered backoff.
+
+        Errors other than client errors and timeouts, e.g. an undecodable
+        body, count as failures and are not retried.
+        """
+        if not self.breaker.allow_request():
+            raise AutobaytCircuitOpenError(
+                f"Autobayt API paused, next probe in {self.breaker.seconds_until_probe():.0f}s"
+            )
+        # Only one call runs while the breaker is open: the recovery probe
+        is_probe = self.breaker.is_open
+        
+        attempt = 0
+        try:
+            while True:
+                await self.bucket.async_acquire()
+                try:
+                    result = await request()
+                except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                    if not _is_transient(err):
+                        # The API answered; it is reachable
+                        self.breaker.record_success()
+                        raise
+                    attempt += 1
+                    if attempt >= API_RETRY_ATTEMPTS or self.breaker.is_open:
+                        self.breaker.record_failure()
+                        raise
+                    delay = random.uniform(
+                        0, min(API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2 ** attempt)
+                    )
+                    _LOGGER.debug(
+                        "Transient API error (%s), retry %d in %.2fs", err, attempt, delay
+                    )
+                    await asyncio.sleep(delay)
+                except Exception:
+                    self.breaker.record_failure()
+                    raise
+                else:
+                    self.breaker.record_success()
+                    return result
+        finally:
+            # A probe that ended without an outcome, e.g. cancelled while
+            # waiting for a token or a retry, must not block later probes
+            if is_probe:
+                self.breaker.release_probe()
+
+
+def _is_transient(err: BaseException) -> bool:
+    """Return True for errors worth retrying."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status == 429 or err.status >= 500
+    return isinstance(err, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
@@ -0,0 +1,127 @@
+"""API instrumentation for Autobayt."""
+from __future__ import annotations
+
+from collections import Counter, deque
+import math
+import time
+from typing import Any, Deque, Dict
+
+# Latency samples kept per endpoint for percentile estimates
+LATENCY_WINDOW = 512
+
+ENDPOINT_USER_DEVICES = "get-things"
+ENDPOINT_DEVICE = "device"
+ENDPOINT_TRIGGER = "trigger"
+
+
+class LatencyHistogram:
+    """Sliding window of request latencies with percentile lookups."""
+
+    __slots__ = ("_samples",)
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        """Initialize an empty window."""
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        """Record one latency sample."""
+        self._samples.append(seconds)
+
+    def percentiles(self) -> Dict[str, float | None]:
+        """Return p50, p95 and p99 in milliseconds."""
+        if not self._samples:
+            return {"p50": None, "p95": None, "p99": None}
+        ordered = sorted(self._samples)
+        return {
+            name: round(_nearest_rank(ordered, q) * 1000, 1)
+            for name, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+        }
+
+
+class AutobaytMetrics:
+    """Request, error and poll-cycle counters of one account."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.cache_hits = 0
+        self.queue_wait = LatencyHistogram()
+        self.queued_requests = 0
+        self.bytes_received = 0
+        self.cycles = 0
+        self.last_cycle_duration: float | None = None
+        self.devices_refreshed = 0
+        self.devices_skipped = 0
+        self.started = time.time()
+
+    def record_request(
+        self, endpoint: str, seconds: float, size: int = 0, error: bool = False
+    ) -> None:
+        """Record one HTTP request attempt."""
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.add(seconds)
+        self.requests[endpoint] += 1
+        self.bytes_received += size
+        if error:
+            self.errors[endpoint] += 1
+
+    def record_queue_wait(self, seconds: float) -> None:
+        """Record how long a request waited for a shared request slot."""
+        self.queue_wait.add(seconds)
+        if seconds > 0:
+            self.queued_requests += 1
+
+    def record_cache_hit(self) -> None:
+        """Record a device fetch served from the detail cache."""
+        self.cache_hits += 1
+
+    def record_cycle(self, seconds: float, refreshed: int, skipped: int) -> None:
+        """Record one coordinator poll cycle."""
+        self.cycles += 1
+        self.last_cycle_duration = seconds
+        self.devices_refreshed = refreshed
+        self.devices_skipped = skipped
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests sent."""
+        return sum(self.requests.values())
+
+    @property
+    def total_errors(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable snapshot."""
+        return {
+            "endpoints": {
+                endpoint: {
+                    "requests": self.requests[endpoint],
+                    "errors": self.errors[endpoint],
+                    "latency_ms": histogram.percentiles(),
+                }
+                for endpoint, histogram in self.latency.items()
+            },
+            "total_requests": self.total_requests,
+            "total_errors": self.total_errors,
+            "bytes_received": self.bytes_received,
+            "cache_hits": self.cache_hits,
+            "queued_requests": self.queued_requests,
+            "queue_wait_ms": self.queue_wait.percentiles(),
+            "cycles": self.cycles,
+            "last_cycle_duration": self.last_cycle_duration,
+            "devices_refreshed": self.devices_refreshed,
+            "devices_skipped": self.devices_skipped,
+            "uptime": round(time.time() - self.started),
+        }
+
+
+def _nearest_rank(ordered: list[float], quantile: float) -> float:
+    """Return the nearest-rank percentile of a sorted list."""
+    index = max(0, math.ceil(quantile * len(ordered)) - 1)
+    return ordered[index]
@@ -0,0 +1,129 @@
+"""Parsed device snapshots for Autobayt."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from .const import (
+    ATTR_BUTTONS,
+    ATTR_CONNECTION_STATUS,
+    ATTR_FIRMWARE_VERSION,
+    ATTR_IS_HUB,
+    ATTR_IS_UPDATING,
+    ATTR_MODEL_NAME,
+    ATTR_NAME,
+    ATTR_NEXT_FIRMWARE,
+    ATTR_PERC,
+    ATTR_ROOM_NAME,
+    ATTR_SLAVE_ID,
+    ATTR_SSTR,
+    BTN_BUTTON_ID,
+    BTN_DPB_STATE,
+    BTN_MODE,
+    BTN_NAME,
+    BTN_POWER_ON_STATE,
+    BTN_SWITCH_STATE,
+    BTN_TOGGLE_DELAY,
+)
+from .device_types import DeviceTypeInfo, get_device_type
+from .firmware import FirmwareInfo, get_firmware_info
+
+
+class AutobaytButton:
+    """A single button of a device."""
+
+    __slots__ = (
+        "button_id",
+        "name",
+        "switch_state",
+        "dpb_state",
+        "power_on_state",
+        "mode",
+        "toggle_delay",
+    )
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        """Parse a button from its API payload."""
+        self.button_id: int | None = data.get(BTN_BUTTON_ID)
+        self.name: str | None = data.get(BTN_NAME)
+        switch_state = data.get(BTN_SWITCH_STATE)
+        self.switch_state: bool | None = switch_state if isinstance(switch_state, bool) else None
+        self.dpb_state = data.get(BTN_DPB_STATE)
+        self.power_on_state = data.get(BTN_POWER_ON_STATE)
+        self.mode = data.get(BTN_MODE)
+        self.toggle_delay = data.get(BTN_TOGGLE_DELAY)
+
+
+class AutobaytDevice:
+    """Device snapshot parsed once per poll.
+
+    Entities read these precomputed fields instead of walking the raw
+    payload on every state render. Buttons are indexed by ``button_id``.
+    """
+
+    __slots__ = (
+        "device_id",
+        "name",
+        "model_name",
+        "firmware_version",
+        "connection_status",
+        "is_hub",
+        "slave_id",
+        "room_name",
+        "sstr",
+        "is_updating",
+        "perc",
+        "next_firmware",
+        "firmware",
+        "device_type",
+        "buttons",
+    )
+
+    def __init__(self, device_id: str, data: Dict[str, Any]) -> None:
+        """Parse a device from its API payload."""
+        self.device_id = device_id
+        self.name: str | None = data.get(ATTR_NAME)
+        self.model_name: str | None = data.get(ATTR_MODEL_NAME)
+        self.firmware_version: str | None = data.get(ATTR_FIRMWARE_VERSION)
+        self.connection_status: bool | None = data.get(ATTR_CONNECTION_STATUS)
+        self.is_hub: bool = bool(data.get(ATTR_IS_HUB, False))
+        self.slave_id: str = data.get(ATTR_SLAVE_ID) or ""
+        self.room_name: str | None = data.get(ATTR_ROOM_NAME)
+        self.sstr: int | None = _parse_int(data.get(ATTR_SSTR))
+        self.is_updating: bool | None = data.get(ATTR_IS_UPDATING)
+        self.perc: int | None = _parse_int(data.get(ATTR_PERC))
+
+        next_firmware = data.get(ATTR_NEXT_FIRMWARE)
+        self.next_firmware: Dict[str, Any] | None = (
+            next_firmware[0]
+            if isinstance(next_firmware, list) and next_firmware and isinstance(next_firmware[0], dict)
+            else None
+        )
+        self.firmware: FirmwareInfo = get_firmware_info(
+            self.firmware_version if isinstance(self.firmware_version, str) else None,
+            _version_name(self.next_firmware),
+        )
+
+        self.device_type: DeviceTypeInfo | None = get_device_type(self.model_name)
+
+        self.buttons: Dict[int, AutobaytButton] = {}
+        for button_data in data.get(ATTR_BUTTONS) or []:
+            button = AutobaytButton(button_data)
+            self.buttons[button.button_id] = button
+
+
+def _version_name(next_firmware: Dict[str, Any] | None) -> str | None:
+    """Return the offered version name, if any."""
+    if not next_firmware:
+        return None
+    version_name = next_firmware.get("version_name")
+    return version_name if isinstance(version_name, str) else None
+
+
+def _parse_int(value: Any) -> int | None:
+    """Return value as int, or None if it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
@@ -0,0 +1,53 @@
+"""Repairs for the Autobayt integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict
+
+from homeassistant.components.repairs import ConfirmRepairFlow, RepairsFlow
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResult
+
+from .const import ISSUE_DEVICE_REMOVED
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemovedDeviceRepairFlow(RepairsFlow):
+    """Remove the config entry of a device deleted from the Autobayt account."""
+
+    def __init__(self, entry_id: str) -> None:
+        """Initialize the flow."""
+        self._entry_id = entry_id
+
+    async def async_step_init(
+        self, user_input: Dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the first step."""
+        return await self.async_step_confirm()
+
+    async def async_step_confirm(
+        self, user_input: Dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Confirm and remove the device entry."""
+        entry = self.hass.config_entries.async_get_entry(self._entry_id)
+        
+        if user_input is not None:
+            if entry is not None:
+                _LOGGER.debug("Removing entry %s of a deleted device", entry.title)
+                await self.hass.config_entries.async_remove(entry.entry_id)
+            return self.async_create_entry(data={})
+
+        return self.async_show_form(
+            step_id="confirm",
+            description_placeholders={"name": entry.title if entry else self._entry_id},
+        )
+
+
+async def async_create_fix_flow(
+    hass: HomeAssistant, issue_id: str, data: Dict[str, Any] | None
+) -> RepairsFlow:
+    """Create the fix flow of an issue."""
+    if issue_id.startswith(f"{ISSUE_DEVICE_REMOVED}_") and data:
+        return RemovedDeviceRepairFlow(data["entry_id"])
+    return ConfirmRepairFlow()
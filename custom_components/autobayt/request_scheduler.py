@@ -0,0 +1,107 @@
+"""Process-wide fair request scheduling across Autobayt accounts."""
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+import logging
+from typing import Any, AsyncIterator, Deque, Dict
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_REQUEST_SCHEDULER, DOMAIN, GLOBAL_MAX_CONCURRENT_REQUESTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AutobaytRequestScheduler:
+    """Global concurrency cap with round-robin fairness between accounts.
+
+    Every account client takes a slot before sending a request. While all
+    slots are busy, requests wait in a FIFO queue per account, and freed
+    slots go to the waiting accounts in turn. An account polling hundreds
+    of devices therefore cannot starve a small account, and the bursts of
+    all accounts together never exceed ``limit`` requests in flight.
+    """
+
+    def __init__(self, limit: int = GLOBAL_MAX_CONCURRENT_REQUESTS) -> None:
+        """Initialize the scheduler."""
+        self.limit = limit
+        self.active = 0
+        self._queues: Dict[str, Deque[asyncio.Future[None]]] = {}
+        # Accounts with waiting requests, in the order they are served next
+        self._rotation: OrderedDict[str, None] = OrderedDict()
+
+    @asynccontextmanager
+    async def slot(self, account: str) -> AsyncIterator[None]:
+        """Hold one request slot for the duration of the block."""
+        await self._async_acquire(account)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def queue_depth(self, account: str) -> int:
+        """Return the number of requests of an account waiting for a slot."""
+        return len(self._queues.get(account, ()))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": {account: len(queue) for account, queue in self._queues.items()},
+        }
+
+    async def _async_acquire(self, account: str) -> None:
+        """Take a slot, waiting for this account's turn if none is free."""
+        if self.active < self.limit and not self._rotation:
+            self.active += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(account, deque()).append(waiter)
+        self._rotation.setdefault(account)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            else:
+                self._discard(account, waiter)
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the next account in turn, or free it."""
+        while self._rotation:
+            account, _ = self._rotation.popitem(last=False)
+            queue = self._queues[account]
+            waiter = queue.popleft()
+            if queue:
+                self._rotation[account] = None
+            else:
+                del self._queues[account]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, account: str, waiter: asyncio.Future[None]) -> None:
+        """Remove a cancelled request from its account queue."""
+        queue = self._queues.get(account)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[account]
+            self._rotation.pop(account, None)
+
+
+@callback
+def async_get_request_scheduler(hass: HomeAssistant) -> AutobaytRequestScheduler:
+    """Return the scheduler shared by all accounts, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_REQUEST_SCHEDULER not in domain_data:
+        domain_data[DATA_REQUEST_SCHEDULER] = AutobaytRequestScheduler()
+    return domain_data[DATA_REQUEST_SCHEDULER]
@@ -0,0 +1,124 @@
+"""Per-device poll scheduling for Autobayt."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable
+
+from .const import (
+    ATTR_CONNECTION_STATUS,
+    ATTR_IS_HUB,
+    ATTR_IS_UPDATING,
+    COMMAND_BURST_DURATION,
+    COMMAND_BURST_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    HUB_OFFLINE_PROBE_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    OFFLINE_MAX_SCAN_INTERVAL,
+    UPDATING_SCAN_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AutobaytPollScheduler:
+    """Decide when each device is next due for a detail poll.
+
+    Intervals follow the last reported state of a device:
+    - ``UPDATING_SCAN_INTERVAL`` while a firmware update is running
+    - ``COMMAND_BURST_INTERVAL`` for a while after a user command
+    - exponential backoff up to ``OFFLINE_MAX_SCAN_INTERVAL`` while offline,
+      capped at ``HUB_OFFLINE_PROBE_INTERVAL`` for hubs
+    - ``DEFAULT_SCAN_INTERVAL`` otherwise
+
+    All times are ``time.monotonic()`` values supplied by the caller.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._next_due: Dict[str, float] = {}
+        self._offline_streak: Dict[str, int] = {}
+        self._burst_until: Dict[str, float] = {}
+        self._failed: set[str] = set()
+
+    def due_devices(self, device_ids: Iterable[str], now: float) -> set[str]:
+        """Return the devices that should be fetched in this cycle."""
+        return {
+            device_id
+            for device_id in device_ids
+            if self._next_due.get(device_id, 0.0) <= now
+        }
+
+    def stalest_first(self, device_ids: Iterable[str]) -> list[str]:
+        """Return devices ordered from the longest overdue to the most recent."""
+        return sorted(device_ids, key=lambda device_id: self._next_due.get(device_id, 0.0))
+
+    def record(self, device_id: str, device: Dict[str, Any] | None, now: float) -> float:
+        """Schedule the next poll of a device from its latest payload."""
+        interval = self._interval_for(device_id, device, now)
+        self._next_due[device_id] = now + interval
+        if device is None:
+            self._failed.add(device_id)
+        else:
+            self._failed.discard(device_id)
+        return interval
+
+    def retry_failed(self, now: float) -> None:
+        """Make devices whose last fetch failed due again, e.g. after an outage."""
+        for device_id in self._failed:
+            self._next_due[device_id] = now
+        self._failed.clear()
+
+    def is_scheduled(self, device_id: str) -> bool:
+        """Return True once a device has been polled at least once."""
+        return device_id in self._next_due
+
+    def boost(self, device_id: str, now: float) -> None:
+        """Poll a device quickly for a while, e.g. after a user command."""
+        self._burst_until[device_id] = now + COMMAND_BURST_DURATION
+        self._next_due[device_id] = min(
+            self._next_due.get(device_id, now), now + COMMAND_BURST_INTERVAL
+        )
+
+    def park(self, device_id: str, now: float) -> None:
+        """Poll a device only on the slow probe schedule, e.g. behind an offline hub."""
+        self._next_due[device_id] = now + HUB_OFFLINE_PROBE_INTERVAL
+
+    def remove(self, device_id: str) -> None:
+        """Forget a device that is no longer monitored."""
+        self._next_due.pop(device_id, None)
+        self._offline_streak.pop(device_id, None)
+        self._burst_until.pop(device_id, None)
+        self._failed.discard(device_id)
+
+    def next_wakeup(self, now: float, *extra_due: float) -> float:
+        """Return seconds until the next poll is due, within the scan limits."""
+        due_times = [*self._next_due.values(), *extra_due]
+        if not due_times:
+            return DEFAULT_SCAN_INTERVAL
+        return min(max(min(due_times) - now, MIN_SCAN_INTERVAL), DEFAULT_SCAN_INTERVAL)
+
+    def _interval_for(self, device_id: str, device: Dict[str, Any] | None, now: float) -> float:
+        """Return the poll interval that fits the reported device state."""
+        if device is None:
+            # Fetch failed; retry on the regular schedule
+            return DEFAULT_SCAN_INTERVAL
+        
+        if device.get(ATTR_CONNECTION_STATUS) is False:
+            streak = self._offline_streak.get(device_id, 0) + 1
+            self._offline_streak[device_id] = streak
+            # A hub is probed no slower than its parked slaves
+            limit = HUB_OFFLINE_PROBE_INTERVAL if device.get(ATTR_IS_HUB) else OFFLINE_MAX_SCAN_INTERVAL
+            return min(DEFAULT_SCAN_INTERVAL * 2 ** (streak - 1), limit)
+        
+        self._offline_streak.pop(device_id, None)
+        
+        if device.get(ATTR_IS_UPDATING):
+            return UPDATING_SCAN_INTERVAL
+        
+        burst_until = self._burst_until.get(device_id)
+        if burst_until is not None:
+            if burst_until > now:
+                return COMMAND_BURST_INTERVAL
+            del self._burst_until[device_id]
+        
+        return DEFAULT_SCAN_INTERVAL
@@ -10,9 +10,14 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -23,13 +28,17 @@ from .const import (
     ATTR_IS_UPDATING,
     ATTR_MODEL_NAME,
     ATTR_NEXT_FIRMWARE,
+    ATTR_PERC,
     ATTR_ROOM_NAME,
     ATTR_SLAVE_ID,
     ATTR_SSTR,
     ATTR_BUTTONS,
     DOMAIN,
+    SIGNAL_HISTORY_FIELD,
 )
 from .coordinator import AutobaytCoordinator
+from .metrics import ENDPOINT_DEVICE, AutobaytMetrics
+from .models import AutobaytDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,9 +57,9 @@ async def async_setup_entry(
         device_id = config_entry.data["device_id"]
         device_data = config_entry.data.get("device_data", {})
         
-        await coordinator.async_add_device(device_id)
-        
         entities.extend(_create_device_sensors(coordinator, device_id, device_data))
+    elif coordinator.user_id:
+        entities.extend(_create_account_sensors(coordinator))
     
     async_add_entities(entities)
 
@@ -69,9 +78,25 @@ def _create_device_sensors(
     ]
 
 
+def _create_account_sensors(coordinator: AutobaytCoordinator) -> list[SensorEntity]:
+    """Create API diagnostic sensors for the account entry."""
+    return [
+        AutobaytApiLatencySensor(coordinator),
+        AutobaytApiRequestsSensor(coordinator),
+        AutobaytApiErrorsSensor(coordinator),
+        AutobaytPollCycleSensor(coordinator),
+        AutobaytDataAgeSensor(coordinator),
+        AutobaytRequestQueueSensor(coordinator),
+        AutobaytWeakSignalSensor(coordinator),
+    ]
+
+
 class AutobaytSensorEntity(CoordinatorEntity, SensorEntity):
     """Base Autobayt sensor entity."""
 
+    # Payload keys rendered by the sensor; None subscribes to every change
+    _source_fields: frozenset[str] | None = None
+
     def __init__(
         self,
         coordinator: AutobaytCoordinator,
@@ -80,53 +105,35 @@ class AutobaytSensorEntity(CoordinatorEntity, SensorEntity):
         sensor_type: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(device_id, self._source_fields))
         self._device_id = device_id
         self._device_name = device_name
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{device_id}_{sensor_type}"
 
     @property
-    def device_info(self) -> Dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        device_data = self.coordinator.data.get("device_data", {}).get(self._device_id, {})
-        model_name = device_data.get(ATTR_MODEL_NAME, "Unknown")
-        firmware_version = device_data.get(ATTR_FIRMWARE_VERSION, "Unknown")
-        
-        info = {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": self._device_name,
-            "manufacturer": "Autobayt",
-            "model": model_name,
-            "sw_version": firmware_version,
-            "connections": {("mac", self._device_id)},
-        }
-        
-        # Add via_device for slave devices connected to a hub
-        is_hub = device_data.get(ATTR_IS_HUB, False)
-        slave_id = device_data.get(ATTR_SLAVE_ID, "")
-        
-        if not is_hub and slave_id:
-            info["via_device"] = (DOMAIN, slave_id)
-        
-        return info
+        return self.coordinator.get_device_info(self._device_id, self._device_name)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data.get("device_data", {})
+            and self._device_id in self.coordinator.devices
         )
 
-    def _get_device_data(self) -> Dict[str, Any]:
-        """Get current device data."""
-        return self.coordinator.data.get("device_data", {}).get(self._device_id, {})
+    def _get_device(self) -> AutobaytDevice | None:
+        """Get the current device record."""
+        return self.coordinator.get_device(self._device_id)
 
 
 class AutobaytConnectionSensor(AutobaytSensorEntity):
     """Autobayt connection status sensor."""
 
+    _source_fields = frozenset({ATTR_CONNECTION_STATUS, ATTR_IS_HUB, ATTR_SLAVE_ID, ATTR_ROOM_NAME})
+
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
@@ -140,8 +147,8 @@ class AutobaytConnectionSensor(AutobaytSensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        device_data = self._get_device_data()
-        connection_status = device_data.get(ATTR_CONNECTION_STATUS)
+        device = self._get_device()
+        connection_status = device.connection_status if device else None
         
         if connection_status is True:
             return "connected"
@@ -152,17 +159,21 @@ class AutobaytConnectionSensor(AutobaytSensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any] | None:
         """Return additional state attributes."""
-        device_data = self._get_device_data()
+        device = self._get_device()
+        if device is None:
+            return None
         return {
-            "is_hub": device_data.get("is_hub"),
-            "slave_id": device_data.get("slave_id"),
-            "room_name": device_data.get(ATTR_ROOM_NAME),
+            "is_hub": device.is_hub,
+            "slave_id": device.slave_id,
+            "room_name": device.room_name,
         }
 
 
 class AutobaytSignalStrengthSensor(AutobaytSensorEntity):
     """Autobayt signal strength sensor."""
 
+    _source_fields = frozenset({ATTR_SSTR, SIGNAL_HISTORY_FIELD})
+
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
@@ -177,20 +188,20 @@ class AutobaytSignalStrengthSensor(AutobaytSensorEntity):
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        device_data = self._get_device_data()
-        sstr = device_data.get(ATTR_SSTR)
-        
-        if sstr is not None:
-            try:
-                return int(sstr)
-            except (ValueError, TypeError):
-                return None
-        return None
+        device = self._get_device()
+        return device.sstr if device else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return min, max, mean and percentiles of the recent samples."""
+        return self.coordinator.signal_history.stats(self._device_id)
 
 
 class AutobaytFirmwareSensor(AutobaytSensorEntity):
     """Autobayt firmware version sensor."""
 
+    _source_fields = frozenset({ATTR_FIRMWARE_VERSION, ATTR_NEXT_FIRMWARE, ATTR_MODEL_NAME})
+
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
@@ -202,21 +213,21 @@ class AutobaytFirmwareSensor(AutobaytSensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        device_data = self._get_device_data()
-        return device_data.get(ATTR_FIRMWARE_VERSION)
+        device = self._get_device()
+        return device.firmware_version if device else None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any] | None:
         """Return additional state attributes."""
-        device_data = self._get_device_data()
-        next_firmware = device_data.get(ATTR_NEXT_FIRMWARE)
+        device = self._get_device()
+        if device is None:
+            return None
         
         attributes = {
-            "model_name": device_data.get(ATTR_MODEL_NAME),
+            "model_name": device.model_name,
         }
         
-        if next_firmware and isinstance(next_firmware, list) and len(next_firmware) > 0:
-            firmware_info = next_firmware[0]
+        if firmware_info := device.next_firmware:
             attributes["next_version"] = firmware_info.get("version_name")
             attributes["next_file"] = firmware_info.get("file_name")
             attributes["version_code"] = firmware_info.get("version_code")
@@ -227,6 +238,8 @@ class AutobaytFirmwareSensor(AutobaytSensorEntity):
 class AutobaytUpdateStatusSensor(AutobaytSensorEntity):
     """Autobayt update status sensor."""
 
+    _source_fields = frozenset({ATTR_IS_UPDATING, ATTR_PERC})
+
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
@@ -240,8 +253,8 @@ class AutobaytUpdateStatusSensor(AutobaytSensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        device_data = self._get_device_data()
-        is_updating = device_data.get(ATTR_IS_UPDATING)
+        device = self._get_device()
+        is_updating = device.is_updating if device else None
         
         if is_updating is True:
             return "updating"
@@ -252,7 +265,196 @@ class AutobaytUpdateStatusSensor(AutobaytSensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any] | None:
         """Return additional state attributes."""
-        device_data = self._get_device_data()
+        device = self._get_device()
+        if device is None:
+            return None
+        return {
+            "update_percentage": device.perc,
+        }
+
+
+class AutobaytAccountSensor(CoordinatorEntity, SensorEntity):
+    """Base Autobayt account diagnostic sensor."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self, coordinator: AutobaytCoordinator, sensor_type: str, name: str
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.user_id}_{sensor_type}"
+        self._attr_name = f"Autobayt {name}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return self.coordinator.get_account_device_info()
+
+    @property
+    def available(self) -> bool:
+        """Return True; metrics stay readable while the API is down."""
+        return True
+
+    @property
+    def _metrics(self) -> AutobaytMetrics:
+        """Return the metrics of the account client."""
+        return self.coordinator.api.metrics
+
+
+class AutobaytApiLatencySensor(AutobaytAccountSensor):
+    """Autobayt device detail request latency sensor."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "api_latency", "API Latency")
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 latency of device detail requests."""
+        histogram = self._metrics.latency.get(ENDPOINT_DEVICE)
+        return histogram.percentiles()["p95"] if histogram else None
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return additional state attributes."""
+        return {
+            endpoint: histogram.percentiles()
+            for endpoint, histogram in self._metrics.latency.items()
+        }
+
+
+class AutobaytApiRequestsSensor(AutobaytAccountSensor):
+    """Autobayt API request counter."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "api_requests", "API Requests")
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of requests sent."""
+        return self._metrics.total_requests
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return additional state attributes."""
         return {
-            "update_percentage": device_data.get("perc"),
+            **self._metrics.requests,
+            "bytes_received": self._metrics.bytes_received,
+        }
+
+
+class AutobaytApiErrorsSensor(AutobaytAccountSensor):
+    """Autobayt API error counter."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "api_errors", "API Errors")
+        self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of failed requests."""
+        return self._metrics.total_errors
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return additional state attributes."""
+        return dict(self._metrics.errors)
+
+
+class AutobaytPollCycleSensor(AutobaytAccountSensor):
+    """Autobayt poll cycle duration sensor."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "poll_cycle", "Poll Cycle Duration")
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_suggested_display_precision = 2
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the duration of the last poll cycle."""
+        return self._metrics.last_cycle_duration
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return additional state attributes."""
+        return {
+            "cycles": self._metrics.cycles,
+            "devices_refreshed": self._metrics.devices_refreshed,
+            "devices_skipped": self._metrics.devices_skipped,
+        }
+
+
+class AutobaytDataAgeSensor(AutobaytAccountSensor):
+    """Autobayt data age sensor."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "data_age", "Data Age")
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_suggested_display_precision = 0
+
+    @property
+    def native_value(self) -> float | None:
+        """Return seconds since the stalest device was last fetched."""
+        return self.coordinator.data_age
+
+
+class AutobaytRequestQueueSensor(AutobaytAccountSensor):
+    """Autobayt shared request queue wait sensor."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "request_queue_wait", "Request Queue Wait")
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 time requests waited for a shared request slot."""
+        return self._metrics.queue_wait.percentiles()["p95"]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return additional state attributes."""
+        api = self.coordinator.api
+        attributes: Dict[str, Any] = {
+            **self._metrics.queue_wait.percentiles(),
+            "queued_requests": self._metrics.queued_requests,
         }
+        if api.scheduler is not None:
+            attributes["queue_depth"] = api.scheduler.queue_depth(api.account)
+            attributes["active_requests"] = api.scheduler.active
+            attributes["request_limit"] = api.scheduler.limit
+        return attributes
+
+
+class AutobaytWeakSignalSensor(AutobaytAccountSensor):
+    """Autobayt fleet signal strength summary sensor."""
+
+    def __init__(self, coordinator: AutobaytCoordinator) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, "weak_signal_devices", "Weak Signal Devices")
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of devices whose median signal is weak."""
+        return self.coordinator.signal_history.fleet_summary()["weak_devices"]
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any] | None:
+        """Return the fleet-wide signal statistics."""
+        return self.coordinator.signal_history.fleet_summary()
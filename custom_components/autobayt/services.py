@@ -0,0 +1,133 @@
+"""Services for the Autobayt integration."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_BUTTON_ID,
+    ATTR_DEVICE_ID,
+    ATTR_STATE,
+    ATTR_TARGETS,
+    DOMAIN,
+    SERVICE_SET_BUTTONS,
+)
+from .coordinator import AutobaytCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_BUTTONS_SCHEMA = vol.Schema({
+    vol.Required(ATTR_TARGETS): vol.All(
+        cv.ensure_list,
+        [
+            vol.Schema({
+                vol.Required(ATTR_DEVICE_ID): cv.string,
+                vol.Required(ATTR_BUTTON_ID): vol.Coerce(int),
+                vol.Required(ATTR_STATE): cv.boolean,
+            })
+        ],
+        vol.Length(min=1),
+    ),
+})
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the Autobayt services."""
+
+    async def async_set_buttons(call: ServiceCall) -> ServiceResponse:
+        """Set many buttons with one trigger request per device."""
+        return await _async_set_buttons(hass, call.data[ATTR_TARGETS])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_BUTTONS,
+        async_set_buttons,
+        schema=SET_BUTTONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _find_coordinators(hass: HomeAssistant) -> Dict[str, AutobaytCoordinator]:
+    """Return the coordinator monitoring each known device, fetched or not."""
+    coordinators: Dict[str, AutobaytCoordinator] = {}
+    # An account coordinator is shared by all of its entries; visit it once
+    for coordinator in {
+        value for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, AutobaytCoordinator)
+    }:
+        for device_id in coordinator.registered_devices | coordinator.devices.keys():
+            coordinators[device_id] = coordinator
+    return coordinators
+
+
+async def _async_set_buttons(
+    hass: HomeAssistant, targets: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Group targets per device, trigger each device once and refresh once.
+
+    The triggers go through each account's command batcher, which bounds
+    how many devices are triggered in parallel. Afterwards every affected
+    account refreshes its triggered devices in a single fan-out.
+    """
+    coordinators = _find_coordinators(hass)
+    results: List[Dict[str, Any]] = [
+        {**target, "success": False, "error": None} for target in targets
+    ]
+
+    # Later targets for the same button win, as in the command batcher
+    grouped: Dict[str, Dict[int, bool]] = {}
+    members: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        device_id = result[ATTR_DEVICE_ID]
+        if device_id not in coordinators:
+            result["error"] = "unknown_device"
+            continue
+        if device_id not in coordinators[device_id].devices:
+            # Registered, but the first fetch has not reported its buttons yet
+            result["error"] = "not_fetched_yet"
+            continue
+        grouped.setdefault(device_id, {})[result[ATTR_BUTTON_ID]] = result[ATTR_STATE]
+        members.setdefault(device_id, []).append(result)
+
+    async def _trigger(device_id: str) -> None:
+        try:
+            await coordinators[device_id].commands.async_set_buttons(
+                device_id, grouped[device_id]
+            )
+        except Exception as err:
+            _LOGGER.error("Failed to set buttons of device %s: %s", device_id, err)
+            for result in members[device_id]:
+                result["error"] = str(err) or type(err).__name__
+            return
+        for result in members[device_id]:
+            result["success"] = True
+
+    await asyncio.gather(*(_trigger(device_id) for device_id in grouped))
+
+    triggered: Dict[AutobaytCoordinator, set[str]] = {}
+    for device_id, device_results in members.items():
+        if device_results[0]["success"]:
+            triggered.setdefault(coordinators[device_id], set()).add(device_id)
+
+    await asyncio.gather(*(
+        coordinator.async_refresh_devices(device_ids)
+        for coordinator, device_ids in triggered.items()
+    ))
+
+    _LOGGER.debug(
+        "Set %d buttons on %d devices with %d trigger requests",
+        sum(len(buttons) for buttons in grouped.values()), len(grouped), len(grouped),
+    )
+    return {"results": results}
@@ -0,0 +1,199 @@
+"""Recent Wi-Fi signal strength samples of Autobayt devices."""
+from __future__ import annotations
+
+from array import array
+import math
+from typing import Any, Dict
+
+from .const import SIGNAL_HISTORY_SIZE, WEAK_SIGNAL_THRESHOLD
+
+# sstr is reported in dBm; one histogram bucket per value of a signed byte
+_OFFSET = 128
+_BUCKETS = 256
+_PERCENTILES = (("p5", 0.05), ("p50", 0.50), ("p95", 0.95))
+
+
+class SignalRing:
+    """Fixed-size ring buffer of sstr samples with running statistics.
+
+    Samples live in a signed byte array and are mirrored in a 256-bucket
+    count histogram, so adding a sample is O(1) and allocates nothing.
+    Min, max and percentiles are read from the histogram and cached until
+    the next sample arrives.
+    """
+
+    __slots__ = ("_samples", "_counts", "_index", "_size", "_total", "_stats")
+
+    def __init__(self, size: int = SIGNAL_HISTORY_SIZE) -> None:
+        """Initialize an empty ring."""
+        self._samples = array("b", bytes(size))
+        self._counts = array("I", bytes(4 * _BUCKETS))
+        self._index = 0
+        self._size = 0
+        self._total = 0
+        self._stats: Dict[str, Any] | None = None
+
+    def add(self, value: int, fleet_counts: array | None = None) -> None:
+        """Add a sample, evicting the oldest one once the ring is full."""
+        value = max(-_OFFSET, min(value, _OFFSET - 1))
+        capacity = len(self._samples)
+
+        if self._size == capacity:
+            evicted = self._samples[self._index]
+            self._counts[evicted + _OFFSET] -= 1
+            self._total -= evicted
+            if fleet_counts is not None:
+                fleet_counts[evicted + _OFFSET] -= 1
+        else:
+            self._size += 1
+
+        self._samples[self._index] = value
+        self._counts[value + _OFFSET] += 1
+        self._total += value
+        if fleet_counts is not None:
+            fleet_counts[value + _OFFSET] += 1
+        self._index = (self._index + 1) % capacity
+        self._stats = None
+
+    def release(self, fleet_counts: array) -> None:
+        """Remove this ring's samples from a fleet histogram."""
+        for bucket, count in enumerate(self._counts):
+            if count:
+                fleet_counts[bucket] -= count
+
+    @property
+    def size(self) -> int:
+        """Return the number of samples held."""
+        return self._size
+
+    @property
+    def total(self) -> int:
+        """Return the sum of the samples held."""
+        return self._total
+
+    def stats(self) -> Dict[str, Any]:
+        """Return min, max, mean and percentiles of the held samples."""
+        if self._stats is None:
+            self._stats = _histogram_stats(self._counts, self._size, self._total)
+        return dict(self._stats)
+
+    @property
+    def median(self) -> int | None:
+        """Return the median sample, or None without samples."""
+        if self._stats is None:
+            self._stats = _histogram_stats(self._counts, self._size, self._total)
+        return self._stats["p50"]
+
+
+class AutobaytSignalHistory:
+    """Signal rings of all devices of a coordinator plus a fleet histogram.
+
+    Every added or removed ring bumps ``version``, which keys the cached
+    fleet summary. Devices with new samples are collected until the
+    coordinator takes them with ``pop_recorded``.
+    """
+
+    def __init__(self, size: int = SIGNAL_HISTORY_SIZE) -> None:
+        """Initialize an empty history."""
+        self._size = size
+        self._rings: Dict[str, SignalRing] = {}
+        self._fleet_counts = array("I", bytes(4 * _BUCKETS))
+        self._fleet_size = 0
+        self._fleet_total = 0
+        self._recorded: set[str] = set()
+        self._summary: tuple[int, int, Dict[str, Any]] | None = None
+        self.version = 0
+
+    def record(self, device_id: str, sstr: Any) -> None:
+        """Add the latest reported sstr of a device, ignoring missing values."""
+        if sstr is None or isinstance(sstr, bool):
+            return
+        try:
+            value = int(sstr)
+        except (TypeError, ValueError):
+            return
+
+        ring = self._rings.get(device_id)
+        if ring is None:
+            ring = self._rings[device_id] = SignalRing(self._size)
+        
+        size, total = ring.size, ring.total
+        ring.add(value, self._fleet_counts)
+        self._fleet_size += ring.size - size
+        self._fleet_total += ring.total - total
+        self._recorded.add(device_id)
+        self.version += 1
+
+    def pop_recorded(self) -> set[str]:
+        """Return and forget the devices that got samples since the last call."""
+        recorded, self._recorded = self._recorded, set()
+        return recorded
+
+    def remove(self, device_id: str) -> None:
+        """Drop the samples of a device that is no longer monitored."""
+        if (ring := self._rings.pop(device_id, None)) is not None:
+            ring.release(self._fleet_counts)
+            self._fleet_size -= ring.size
+            self._fleet_total -= ring.total
+            self._recorded.discard(device_id)
+            self.version += 1
+
+    def stats(self, device_id: str) -> Dict[str, Any] | None:
+        """Return the statistics of one device, or None without samples."""
+        ring = self._rings.get(device_id)
+        return ring.stats() if ring else None
+
+    def fleet_summary(self, weakest: int = 10) -> Dict[str, Any]:
+        """Return fleet-wide statistics and the devices with a weak signal.
+
+        A device counts as weak when its median sample is below
+        ``WEAK_SIGNAL_THRESHOLD``. Only the ``weakest`` devices are listed
+        so the summary stays small enough for state attributes. The result
+        is reused until the next sample arrives.
+        """
+        if self._summary is not None and self._summary[:2] == (self.version, weakest):
+            return self._summary[2]
+        
+        weak = sorted(
+            (median, device_id)
+            for device_id, ring in self._rings.items()
+            if ring.size and (median := ring.median) < WEAK_SIGNAL_THRESHOLD
+        )
+        summary = {
+            "devices": len(self._rings),
+            **_histogram_stats(self._fleet_counts, self._fleet_size, self._fleet_total),
+            "weak_threshold": WEAK_SIGNAL_THRESHOLD,
+            "weak_devices": len(weak),
+            "weakest": {device_id: median for median, device_id in weak[:weakest]},
+        }
+        self._summary = (self.version, weakest, summary)
+        return summary
+
+
+def _histogram_stats(counts: array, size: int, total: int) -> Dict[str, Any]:
+    """Return statistics of the samples described by a count histogram."""
+    result: Dict[str, Any] = {
+        "samples": size,
+        "min": None,
+        "max": None,
+        "mean": round(total / size, 1) if size else None,
+        **{name: None for name, _ in _PERCENTILES},
+    }
+    if not size:
+        return result
+
+    ranks = {name: max(1, math.ceil(quantile * size)) for name, quantile in _PERCENTILES}
+    seen = 0
+    for bucket, count in enumerate(counts):
+        if not count:
+            continue
+        value = bucket - _OFFSET
+        if result["min"] is None:
+            result["min"] = value
+        result["max"] = value
+        previous, seen = seen, seen + count
+        for name, rank in ranks.items():
+            if previous < rank <= seen:
+                result[name] = value
+
+    return result
@@ -0,0 +1,61 @@
+"""Persistent device snapshots for Autobayt."""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Callable, Dict
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_MAX_AGE, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AutobaytSnapshotStore:
+    """Last good poll result of a coordinator, kept on disk.
+
+    The stored document holds the raw payloads of the monitored devices,
+    the account device list and the wall-clock time each device was last
+    fetched::
+
+        {"saved_at": 1700000000.0, "user_devices": [...],
+         "device_data": {...}, "updated_at": {device_id: timestamp}}
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str) -> None:
+        """Initialize the store for a user_id or device_id."""
+        safe_key = key.replace(":", "").lower()
+        self._store: Store[Dict[str, Any]] = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            f"{DOMAIN}.snapshot_{safe_key}",
+            private=True,
+        )
+
+    async def async_load(self) -> Dict[str, Any] | None:
+        """Return the stored snapshot, or None if missing or too old."""
+        try:
+            snapshot = await self._store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not read Autobayt snapshot: %s", err)
+            return None
+        
+        if not snapshot or not isinstance(snapshot.get("device_data"), dict):
+            return None
+        
+        age = time.time() - snapshot.get("saved_at", 0)
+        if age > SNAPSHOT_MAX_AGE:
+            _LOGGER.debug("Ignoring Autobayt snapshot that is %.0fs old", age)
+            return None
+        
+        return snapshot
+
+    def async_schedule_save(self, data_func: Callable[[], Dict[str, Any]]) -> None:
+        """Write the snapshot after a short delay, coalescing frequent saves."""
+        self._store.async_delay_save(data_func, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshot."""
+        await self._store.async_remove()
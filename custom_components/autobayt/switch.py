@@ -2,20 +2,19 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any
 
 import aiohttp
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     DOMAIN,
-    DEVICE_TRIGGER_URL,
     ATTR_BUTTONS,
-    BTN_SWITCH_STATE,
     BTN_BUTTON_ID,
     BTN_NAME,
 )
@@ -39,8 +38,6 @@ async def async_setup_entry(
         device_data = config_entry.data.get("device_data", {})
         device_name = device_data.get("name", "Autobayt Device")
         
-        await coordinator.async_add_device(device_id)
-        
         buttons = device_data.get(ATTR_BUTTONS, [])
         for button in buttons:
             button_id = button.get(BTN_BUTTON_ID, 0)
@@ -61,6 +58,8 @@ async def async_setup_entry(
 class AutobaytSwitchEntity(CoordinatorEntity, SwitchEntity):
     """Autobayt switch entity."""
 
+    _source_fields = frozenset({ATTR_BUTTONS})
+
     def __init__(
         self,
         coordinator: AutobaytCoordinator,
@@ -70,59 +69,41 @@ class AutobaytSwitchEntity(CoordinatorEntity, SwitchEntity):
         button_name: str,
     ) -> None:
         """Initialize the switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(device_id, self._source_fields))
         self._device_id = device_id
         self._device_name = device_name
         self._button_id = button_id
         self._button_name = button_name
         self._attr_unique_id = f"{device_id}_button_{button_id}"
         self._attr_name = f"{device_name} {button_name}"
+        self._optimistic_state: bool | None = None
+        self._command_seq = 0
 
     @property
-    def device_info(self) -> Dict[str, Any]:
+    def device_info(self) -> DeviceInfo:
         """Return device information."""
-        device_data = self.coordinator.data.get("device_data", {}).get(self._device_id, {})
-        model_name = device_data.get("model_name", "Unknown")
-        firmware_version = device_data.get("firmware_version", "Unknown")
-        
-        info = {
-            "identifiers": {(DOMAIN, self._device_id)},
-            "name": self._device_name,
-            "manufacturer": "Autobayt",
-            "model": model_name,
-            "sw_version": firmware_version,
-            "connections": {("mac", self._device_id)},
-        }
-        
-        # Add via_device for slave devices connected to a hub
-        is_hub = device_data.get("is_hub", False)
-        slave_id = device_data.get("slave_id", "")
-        
-        if not is_hub and slave_id:
-            info["via_device"] = (DOMAIN, slave_id)
-        
-        return info
+        return self.coordinator.get_device_info(self._device_id, self._device_name)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data.get("device_data", {})
+            and self._device_id in self.coordinator.devices
         )
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        device_data = self.coordinator.data.get("device_data", {}).get(self._device_id, {})
-        buttons = device_data.get(ATTR_BUTTONS, [])
+        if self._optimistic_state is not None:
+            return self._optimistic_state
         
-        for button in buttons:
-            if button.get(BTN_BUTTON_ID) == self._button_id:
-                switch_state = button.get(BTN_SWITCH_STATE)
-                return switch_state if isinstance(switch_state, bool) else None
+        device = self.coordinator.get_device(self._device_id)
+        if device is None:
+            return None
         
-        return None
+        button = device.buttons.get(self._button_id)
+        return button.switch_state if button else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -133,36 +114,69 @@ class AutobaytSwitchEntity(CoordinatorEntity, SwitchEntity):
         await self._async_set_switch_state(False)
 
     async def _async_set_switch_state(self, state: bool) -> None:
-        """Set the switch state."""
-        payload = {
-            "btnStates": [state],
-            "btnIds": [self._button_id],
-            "device_id": self._device_id
-        }
+        """Set the switch state.
+
+        The commanded state is shown immediately and confirmed in the
+        background by re-polling only this device.
+        """
+        self._command_seq += 1
+        seq = self._command_seq
+        self._optimistic_state = state
+        self.async_write_ha_state()
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    DEVICE_TRIGGER_URL, 
-                    json=payload, 
-                    headers={"Content-Type": "application/json"},
-                    timeout=30
-                ) as response:
-                    response.raise_for_status()
-                    _LOGGER.debug(
-                        "Successfully set switch state for device %s button %s to %s", 
-                        self._device_id, self._button_id, state
-                    )
-                    
-                    await self.coordinator.async_request_refresh()
-                    
+            await self.coordinator.commands.async_set_button(
+                self._device_id, self._button_id, state
+            )
+            _LOGGER.debug(
+                "Successfully set switch state for device %s button %s to %s", 
+                self._device_id, self._button_id, state
+            )
         except aiohttp.ClientError as err:
             _LOGGER.error(
                 "Failed to set switch state for device %s button %s: %s", 
                 self._device_id, self._button_id, err
             )
+            self._async_clear_optimistic_state(seq)
+            return
         except Exception as err:
             _LOGGER.error(
                 "Unexpected error setting switch state for device %s button %s: %s", 
                 self._device_id, self._button_id, err
             )
+            self._async_clear_optimistic_state(seq)
+            return
+        
+        self.hass.async_create_task(self._async_confirm_state(seq, state))
+
+    async def _async_confirm_state(self, seq: int, state: bool) -> None:
+        """Wait for the device to report the commanded state.
+
+        The optimistic state is cleared however the confirmation ends, so a
+        failed or cancelled confirmation cannot pin a stale state.
+        """
+        try:
+            confirmed = await self.coordinator.async_confirm_buttons(
+                self._device_id, {self._button_id: state}
+            )
+            if not confirmed and seq == self._command_seq:
+                _LOGGER.warning(
+                    "Device %s button %s did not confirm state %s, rolling back", 
+                    self._device_id, self._button_id, state
+                )
+        except Exception as err:
+            _LOGGER.error(
+                "Error confirming state of device %s button %s: %s",
+                self._device_id, self._button_id, err
+            )
+        finally:
+            self._async_clear_optimistic_state(seq)
+
+    @callback
+    def _async_clear_optimistic_state(self, seq: int) -> None:
+        """Drop the optimistic state unless a newer command replaced it."""
+        if seq != self._command_seq:
+            return
+        self._optimistic_state = None
+        if self.hass is not None:
+            self.async_write_ha_state()
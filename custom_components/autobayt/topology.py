@@ -0,0 +1,83 @@
+"""Hub and slave topology of Autobayt devices."""
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping
+
+from .const import ATTR_CONNECTION_STATUS, ATTR_IS_HUB, ATTR_SLAVE_ID
+
+
+class AutobaytTopology:
+    """Index of which devices reach the cloud through which hub.
+
+    Slaves report the device_id of their hub in ``slave_id``. The index is
+    rebuilt from every poll snapshot and tracks which hubs are offline, so
+    the coordinator can stop polling branches that cannot answer anyway.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._branches: Dict[str, set[str]] = {}
+        self._offline_hubs: set[str] = set()
+
+    def rebuild(
+        self, device_data: Mapping[str, Mapping[str, Any]]
+    ) -> tuple[set[str], set[str]]:
+        """Re-index from a snapshot.
+
+        Returns:
+            Tuple of (went_offline, recovered) hub device_ids compared with
+            the previous snapshot.
+        """
+        branches: Dict[str, set[str]] = {}
+        offline: set[str] = set()
+
+        for device_id, device in device_data.items():
+            if device.get(ATTR_IS_HUB):
+                branches.setdefault(device_id, set())
+                if device.get(ATTR_CONNECTION_STATUS) is False:
+                    offline.add(device_id)
+            elif hub_id := device.get(ATTR_SLAVE_ID):
+                branches.setdefault(hub_id, set()).add(device_id)
+
+        went_offline = offline - self._offline_hubs
+        recovered = {
+            hub_id for hub_id in self._offline_hubs - offline if hub_id in device_data
+        }
+        self._branches = branches
+        self._offline_hubs = offline
+        return went_offline, recovered
+
+    def answering_hubs(self, payloads: Mapping[str, Mapping[str, Any]]) -> set[str]:
+        """Return offline hubs with a slave that reports itself online.
+
+        A slave can only answer through its hub, so an online slave in
+        ``payloads`` proves the hub is back before the hub's own probe does.
+        """
+        return {
+            hub_id
+            for hub_id in self._offline_hubs
+            if any(
+                payloads[slave_id].get(ATTR_CONNECTION_STATUS) is True
+                for slave_id in self._branches.get(hub_id, ())
+                if slave_id in payloads
+            )
+        }
+
+    def branch(self, hub_id: str) -> set[str]:
+        """Return the slaves of a hub."""
+        return self._branches.get(hub_id, set())
+
+    @property
+    def offline_hubs(self) -> set[str]:
+        """Return the hubs that reported themselves offline."""
+        return self._offline_hubs
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {
+            "hubs": len(self._branches),
+            "offline_hubs": sorted(self._offline_hubs),
+            "unreachable_devices": sum(
+                len(self._branches.get(hub_id, ())) for hub_id in self._offline_hubs
+            ),
+        }
@@ -7,11 +7,20 @@ from typing import Any
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    ATTR_FIRMWARE_VERSION,
+    ATTR_IS_UPDATING,
+    ATTR_MODEL_NAME,
+    ATTR_NEXT_FIRMWARE,
+    ATTR_PERC,
+    DOMAIN,
+)
 from .coordinator import AutobaytCoordinator
+from .models import AutobaytDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,19 +34,20 @@ async def async_setup_entry(
     coordinator: AutobaytCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
-    device_data_dict = coordinator.data.get("device_data", {})
-    for device_id, device_data in device_data_dict.items():
-        # Skip invalid entries
-        if not device_id or not isinstance(device_data, dict):
-            _LOGGER.warning("Skipping invalid device entry: %s", device_id)
-            continue
-            
+    
+    # The account coordinator holds every device of the account, so only
+    # create the update entity for the device this entry belongs to.
+    device_id = config_entry.data.get("device_id")
+    if device_id:
+        device_data = coordinator.data.get("device_data", {}).get(device_id)
+        if not isinstance(device_data, dict):
+            device_data = config_entry.data.get("device_data", {})
+        
         device_name = device_data.get("name")
-        if not device_name:
+        if device_name:
+            entities.append(AutobaytUpdateEntity(coordinator, device_id, device_name))
+        else:
             _LOGGER.warning("Skipping device with no name: %s", device_id)
-            continue
-            
-        entities.append(AutobaytUpdateEntity(coordinator, device_id, device_name))
 
     async_add_entities(entities)
 
@@ -47,54 +57,53 @@ class AutobaytUpdateEntity(CoordinatorEntity, UpdateEntity):
 
     _attr_has_entity_name = True
     _attr_supported_features = UpdateEntityFeature.PROGRESS
+    _source_fields = frozenset({
+        ATTR_FIRMWARE_VERSION,
+        ATTR_IS_UPDATING,
+        ATTR_MODEL_NAME,
+        ATTR_NEXT_FIRMWARE,
+        ATTR_PERC,
+    })
 
     def __init__(
         self, coordinator: AutobaytCoordinator, device_id: str, device_name: str
     ) -> None:
         """Initialize the update entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(device_id, self._source_fields))
         self._device_id = device_id
         self._device_name = device_name
         self._attr_unique_id = f"{device_id}_firmware_update"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-        }
         self._attr_name = "Firmware"
 
-    def _get_device_data(self) -> dict[str, Any]:
-        """Get device data from coordinator."""
-        return self.coordinator.data.get("device_data", {}).get(self._device_id, {})
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return self.coordinator.get_device_info(self._device_id, self._device_name)
+
+    def _get_device(self) -> AutobaytDevice | None:
+        """Get the device record from coordinator."""
+        return self.coordinator.get_device(self._device_id)
 
     @property
     def installed_version(self) -> str | None:
         """Return the current installed version."""
-        device_data = self._get_device_data()
-        return device_data.get("firmware_version")
+        device = self._get_device()
+        return device.firmware_version if device else None
 
     @property
     def latest_version(self) -> str | None:
         """Return the latest available version."""
-        device_data = self._get_device_data()
-        next_firmware = device_data.get("next_firmware", [])
-        
-        if next_firmware and len(next_firmware) > 0:
-            latest = next_firmware[0].get("version_name")
-            # Only return if different from installed version
-            if latest and latest != self.installed_version:
-                return latest
-        
-        return self.installed_version
+        device = self._get_device()
+        return device.firmware.latest_version if device else None
 
     @property
     def in_progress(self) -> bool | int:
         """Update installation progress."""
-        device_data = self._get_device_data()
-        is_updating = device_data.get("is_updating", False)
+        device = self._get_device()
         
-        if is_updating:
-            perc = device_data.get("perc", 0)
-            if perc > 0:
-                return perc
+        if device and device.is_updating:
+            if device.perc and device.perc > 0:
+                return device.perc
             return True
         
         return False
@@ -102,19 +111,17 @@ class AutobaytUpdateEntity(CoordinatorEntity, UpdateEntity):
     @property
     def title(self) -> str | None:
         """Return the title of the update."""
-        device_data = self._get_device_data()
-        model = device_data.get("model_name", "Autobayt Device")
+        device = self._get_device()
+        model = device.model_name if device and device.model_name else "Autobayt Device"
         return f"{model} Firmware"
 
     @property
     def release_summary(self) -> str | None:
         """Return the release summary."""
-        device_data = self._get_device_data()
-        next_firmware = device_data.get("next_firmware", [])
+        device = self._get_device()
         
-        if next_firmware and len(next_firmware) > 0:
-            firmware_info = next_firmware[0]
-            file_name = firmware_info.get("file_name", "")
+        if device and device.next_firmware:
+            file_name = device.next_firmware.get("file_name", "")
             return f"Firmware update available: {file_name}"
         
         return None
@@ -124,26 +131,26 @@ class AutobaytUpdateEntity(CoordinatorEntity, UpdateEntity):
         """Return True if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._device_id in self.coordinator.data.get("device_data", {})
+            and self._device_id in self.coordinator.devices
         )
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
-        device_data = self._get_device_data()
-        next_firmware = device_data.get("next_firmware", [])
+        device = self._get_device()
+        if device is None:
+            return None
         
         attrs = {}
         
-        if next_firmware and len(next_firmware) > 0:
-            firmware_info = next_firmware[0]
+        if firmware_info := device.next_firmware:
             attrs.update({
                 "file_name": firmware_info.get("file_name"),
                 "version_code": firmware_info.get("version_code"),
                 "requires_client_update": firmware_info.get("require_client_update", False),
             })
         
-        if device_data.get("is_updating"):
-            attrs["update_percentage"] = device_data.get("perc", 0)
+        if device.is_updating:
+            attrs["update_percentage"] = device.perc or 0
         
         return attrs if attrs else None